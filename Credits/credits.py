@@ -1,5 +1,5 @@
-import os
 import shutil
+from Terminal import terminal
 
 # Initialize some variables for use in displaying the credits screen
 cols, rows = shutil.get_terminal_size()
@@ -29,7 +29,7 @@ def display():
     """
     selection = -1
     while selection != ' ':
-        os.system('clear')
+        terminal.clear()
         print ('█' * cols)
         print('\n' * centerTopBottom)
         # Print a top border to the box
@@ -0,0 +1,120 @@
+import asyncio
+import sys
+import time
+from Terminal import terminal
+from Wrapper import wrapper
+
+
+class Cutscene:
+    """Class used to represent a timed sequence of output, such as the end of the Game
+
+    A Cutscene is a timeline of frames, played in order. Each frame either shows something or waits. The same
+    Cutscene can be played in the foreground, which blocks while it waits, or on an asyncio event loop, which leaves
+    the loop free to run other sessions while it waits. When fast-forwarded every wait is skipped. Frames are written
+    to the sink they are played to, sys.stdout if none is given.
+
+    The Game loop is synchronous, so the Game itself only ever uses play(), fast-forwarded when there is no terminal.
+    play_async() is for callers that are already coroutines running on an event loop.
+
+    Attributes
+    ----------
+    frames: list
+        (kind, value) pairs. kind is one of 'clear', 'text' (wrapped like Task output), 'line' (printed as it is)
+        or 'wait' (value is the number of seconds)
+
+    Methods
+    -------
+    add()
+        adds a frame to the end of the timeline
+    duration()
+        returns the total time the Cutscene waits for
+    play()
+        plays the Cutscene, blocking until it has finished
+    play_async()
+        plays the Cutscene on an asyncio event loop, without blocking it
+    show_frame()
+        shows a single frame that isn't a wait
+    """
+
+    def __init__(self, frames=None):
+        """Constructor for the Cutscene class
+
+        :param list frames: (kind, value) pairs to start the timeline with
+        """
+        self.frames = list(frames or [])
+
+    def add(self, kind, value=None):
+        """Adds a frame to the end of the timeline
+
+        :param str kind: 'clear', 'text', 'line' or 'wait'
+        :param value: the text shown, or the seconds waited
+        :return: Cutscene, so calls can be chained
+        """
+        self.frames.append((kind, value))
+        return self
+
+    def duration(self):
+        """Returns the total time the Cutscene waits for
+
+        :return: int seconds
+        """
+        return sum(value for kind, value in self.frames if kind == 'wait')
+
+    def play(self, sink=None, fast_forward=False):
+        """Plays the Cutscene in the foreground
+
+        :param file sink: the session's output, sys.stdout if None
+        :param bool fast_forward: True to skip the waits ex: when there is no terminal to watch them
+        :return: VOID
+        """
+        if sink is None:
+            sink = sys.stdout
+        for kind, value in self.frames:
+            if kind == 'wait':
+                # Show everything so far before waiting
+                sink.flush()
+                if not fast_forward:
+                    time.sleep(value)
+            else:
+                self.show_frame(kind, value, sink)
+        sink.flush()
+
+    async def play_async(self, sink=None, fast_forward=False):
+        """Plays the Cutscene as a coroutine. While it waits the event loop is free to run other tasks
+
+        :param file sink: the session's output, sys.stdout if None
+        :param bool fast_forward: True to skip the waits
+        :return: VOID
+        """
+        if sink is None:
+            sink = sys.stdout
+        for kind, value in self.frames:
+            if kind == 'wait':
+                sink.flush()
+                if not fast_forward:
+                    await asyncio.sleep(value)
+            else:
+                self.show_frame(kind, value, sink)
+        sink.flush()
+
+    def show_frame(self, kind, value, sink=None):
+        """Shows a frame
+
+        :param str kind: 'clear', 'text' or 'line'
+        :param str value: the text shown
+        :param file sink: the session's output, sys.stdout if None
+        :return: VOID
+        """
+        if sink is None:
+            sink = sys.stdout
+        if kind == 'clear':
+            # Show everything so far, then clear the screen
+            sink.flush()
+            sink.write(terminal.sequence('clear'))
+            sink.flush()
+        elif kind == 'text':
+            print(file=sink)
+            for line in wrapper.render(value, color_mode=getattr(sink, 'color_mode', None)):
+                print(line, file=sink)
+        else:
+            print(value, file=sink)
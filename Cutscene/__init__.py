@@ -0,0 +1 @@
+from Cutscene.Cutscene import Cutscene
\ No newline at end of file
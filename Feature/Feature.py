@@ -1,3 +1,6 @@
+from Wrapper import wrapper
+
+
 class Feature:
     """ Class used to represent a static feature with a Room
 
@@ -19,15 +22,24 @@ class Feature:
         manages the state of the Feature
     feature_id: int
         unique identifier of the Feature within the Room
+    rendered: dict
+        key - description attribute name, value - (hash of the text, wrapped and colorized text)
 
     Methods
     -------
     get_description():
         returns the appropriate description based on Feature state
+    compile_descriptions()
+        wraps and colorizes every description ahead of time
+    get_rendered_description()
+        returns the wrapped and colorized description based on Feature state
     save_feature()
         returns dictionary representation of the Feature for saving
     """
 
+    # Description attributes, in the order of the states that show them
+    description_fields = ('pre_action_des', 'in_action_des', 'post_action_des')
+
     def __init__(self, name, pre_action_des, in_action_des, post_action_des, actionable, usable, state, feature_id):
 
         """Constructor for the Feature class
@@ -49,6 +61,7 @@ class Feature:
         self.usable = usable
         self.state = state
         self.feature_id = feature_id
+        self.rendered = {}
 
     def __repr__(self):
         return self
@@ -65,6 +78,21 @@ class Feature:
         else:
             return self.post_action_des
 
+    def compile_descriptions(self):
+        """Wraps and colorizes each description so looking at the Feature only prints stored text
+
+        :return: VOID
+        """
+        for field in self.description_fields:
+            wrapper.render_field(self, field, markup=True)
+
+    def get_rendered_description(self):
+        """ Provides the wrapped and colorized description based on Feature state
+
+        :return: str : lines of the description, ready to print
+        """
+        return wrapper.render_field(self, self.description_fields[min(self.state, 2)], markup=True)
+
     def save_feature(self):
         """Provides dict representation of the Feature for saving
 
@@ -6,8 +6,11 @@ from Credits import credits
 from Hero import Hero
 from Intro import intro
 from Inventory import Inventory
+from Layout import layout
 from inventoryMapScreen import inventoryMapScreen
 from Menu import menu
+from Outcome import Outcome
+from OutputSink import TerminalSink, session_output
 from Room import Room
 from Task import Task
 import textwrap
@@ -29,11 +32,20 @@ class Game:
         the Game Inventory that provides carrying/dropping abilities
     tasks: Task
         the interactions within the Game that can/must be completed
+    map_state: MapState
+        the world flags, explored rooms and map drawings of the game being played
+    output: OutputSink
+        where printed output is collected during play, and the session's color mode. A TerminalSink on stdout in
+        'ansi' mode unless set before start() or play_game()
+    outcome: Outcome
+        how the Game ended, None while it is being played
 
     Methods
     -------
     start()
         displays menu allows user to start the Game
+    run_menu()
+        displays the menu until the user exits or a Game ends
     initializes_rooms()
         loads file data and initializes the Room objects
     move()
@@ -50,37 +62,66 @@ class Game:
         saves the game data to load files for continuation
     get_command()
         retrieves user input for actions to be carried out
+    get_outcome()
+        returns how the Game ended, if it has
+    run_command()
+        carries out one parsed command
     play_game()
         main Game driver function
+    run_game()
+        loads the Game and runs the game loop, with output going to the sink
 
     """
     rooms_list = list()
     hero = None
     inventory = None
     tasks = Task()
+    map_state = None
+    output = None
+    outcome = None
     parser = languageParser.LanguageParser()
 
     def start(self):
         """Displays the menu in a loop and allows user to start the Game
 
+        :return: VOID
+        """
+        # The intro and credits are part of the session too, and are shown in its color mode
+        if self.output is None:
+            self.output = TerminalSink(sys.stdout)
+
+        with session_output(self.output):
+            try:
+                self.run_menu()
+            finally:
+                self.output.flush()
+
+    def run_menu(self):
+        """Displays the menu until the user exits or a Game ends
+
         :return: VOID
         """
         while 1:
             item_list = []
+            outcome = None
             selection = menu.display()
             if selection == 'newgame':
                 intro.display()
-                self.play_game('dataStore/newGame/load_file.json', 'dataStore/newGame/RoomState/', item_list)
+                outcome = self.play_game('dataStore/newGame/load_file.json', 'dataStore/newGame/RoomState/', item_list)
             elif selection == 'loadgame':
                 # Check if saved game exists to load
                 load_file = Path('dataStore/savedGame/load_file.json')
                 if load_file.is_file():
-                    self.play_game(load_file, 'dataStore/savedGame/RoomState/', item_list)
+                    outcome = self.play_game(load_file, 'dataStore/savedGame/RoomState/', item_list)
             elif selection == 'credits':
                 credits.display()
             elif selection == 'exit':
                 break
 
+            # The program ends along with the game
+            if outcome is not None:
+                break
+
     def initialize_rooms(self, data, file_path):
         """Creates Room objects based on the data passed to the function
 
@@ -106,8 +147,12 @@ class Game:
                 room_data['directions'],
                 room_data['startingItems'],
                 room_data['droppedItems'],
-                room_data['features']
+                room_data['features'],
+                room_data.get('nextLongDes')
             )
+            # Wrap and colorize the descriptions now, so showing them later only prints stored text
+            new_room.compile_descriptions()
+
             # Room objects are placed into the rooms list() at specific
             # locations according the the room_id
             self.rooms_list.insert(new_room.room_id, new_room)
@@ -116,7 +161,7 @@ class Game:
         """Manages movement of the Hero within the Game
 
         :param str direction: user input direction to move
-        :return: VOID
+        :return: bool True if the Hero moved, False otherwise
         """
         # set the current room to where the hero is located
         current_room = self.rooms_list[self.hero.location]
@@ -126,19 +171,21 @@ class Game:
         if direction in current_room.directions:
             # change the hero's location to the new room
             self.hero.location = current_room.directions[direction]
+            inventoryMapScreen.explore(self.hero.location, self.map_state)
             # Check if a task is necessary on move into next room and get the status. Currently nothing done with the status.
             self.tasks.perform_task_on_move(self.inventory, self.rooms_list, self.hero.location)
             # Hero time increment operation
             self.hero.time = self.hero.set_time()
             self.rooms_list[self.hero.location].get_description()
+            return True
 
-
+        return False
 
     def take(self, str_input):
         """Removes an Item from a Room and places it in the Inventory
 
         :param str str_input: user input of Item to be taken
-        :return: VOID
+        :return: bool True if the Item was taken, False otherwise
         """
         # set the current room to where the hero is located
         current_room = self.rooms_list[self.hero.location]
@@ -150,23 +197,26 @@ class Game:
             status, taken_item = current_room.take_item(str_input)
         else:
             self.print_output("You cannot fit anymore items in your inventory.")
-            return
+            return False
 
         # if the Item was there put it in the Inventory
         if status == True:
             self.inventory.add_item(taken_item)
             # Check to determine if acquisition is part of a task
             # attempt to perform the task and get the status. Currently nothing done with the status.
-            status = self.tasks.perform_task(taken_item, None, self.rooms_list)
+            self.tasks.perform_task(taken_item, None, self.rooms_list)
+            inventoryMapScreen.update_flags(self.rooms_list, self.map_state)
+            return True
         else:
             self.print_output("That is not an item you can take.")
+            return False
 
     def use(self, str_item, str_feature):
         """Attempts to perform an action with an Item and/or a Feature
 
         :param str str_item: user input of Item wished to be used
         :param str str_feature: user input of Feature to be used
-        :return: VOID
+        :return: bool True if the action was performed, False otherwise
         """
         current_room = self.rooms_list[self.hero.location]
 
@@ -175,7 +225,8 @@ class Game:
 
         # False Feature status - feature is not in the Room
         if not feat_status:
-            print((' ' * 20) + 'There is no {} in the room.'.format(str_feature))
+            print(layout.indent + 'There is no {} in the room.'.format(str_feature))
+            return False
         else:
             # Key counter variable to check if user has both keys in posession
             key_counter = 0
@@ -207,6 +258,11 @@ class Game:
             if feat_status and item_status:
                 # attempt to perform the task and get the status
                 status = self.tasks.perform_task(item, feat, self.rooms_list)
+                inventoryMapScreen.update_flags(self.rooms_list, self.map_state)
+
+                # The Task ended the Game, or offered a choice that will. Nothing else happens
+                if self.tasks.outcome is not None or self.tasks.choice is not None:
+                    return True
 
                 # True, means this is a valid Item/Feature combination
                 if status:
@@ -214,19 +270,22 @@ class Game:
                     self.hero.time = self.hero.set_time()
                     # Remove the item from the inventory
                     self.inventory.remove_item(item)
+                    return True
                 else:
                     # Else this is not a valid combination
                     self.print_output(' ...you cannot do that now.')
 
             # False Item status - item is not in the Inventory
             elif not item_status:
-                print((' ' * 20) + 'There is no {} in the inventory.'.format(str_item))
+                print(layout.indent + 'There is no {} in the inventory.'.format(str_item))
+
+            return False
 
     def drop(self, item_name):
         """Removes an Item from the Inventory and leaves it in a Room
 
         :param str item_name: user input of Item to be dropped
-        :return: VOID
+        :return: bool True if the Item was dropped, False otherwise
         """
 
         # set the current room to where the hero is located
@@ -244,11 +303,13 @@ class Game:
         else:
             self.print_output('That item is not in your inventory.')
 
+        return status
+
     def look_at_something(self, thing):
         """Gets the description of an Item or Feature in a Room or Inventory
 
         :param str thing: user input of Item/Feature to be looked at
-        :return: VOID
+        :return: bool True if the Item/Feature was found, False otherwise
         """
         # set the current room to where the hero is located
         current_room = self.rooms_list[self.hero.location]
@@ -257,30 +318,38 @@ class Game:
         # the starting_items, dropped_items, and features
         thing_in_room, thing_room_des = current_room.look_in_room(thing)
         # check to see if the 'thing' is in the Inventory
-        thing_in_inven, thing_inven_des = self.inventory.look_in_inventory(thing)
+        thing_in_inven, inven_item = self.inventory.in_inventory(thing)
 
         # the thing is in the Room so print the description
         if thing_in_room:
             print()
-            # Print the feature description via the wrap processor to preserve colors
-            processed = wrapper.wrap_processor(thing_room_des)
-            for i in processed:
-                print(i)
-            # Check to see if a task is associated with look operation
-            self.tasks.perform_task_on_look(thing_room_des, self.rooms_list, self.hero.time)
+            # Print the feature description via the wrap processor to preserve colors. Features were compiled
+            # when the Room was loaded
+            kind, item_or_feature = current_room.in_room(thing)
+            if kind == 2:
+                print(item_or_feature.get_rendered_description())
+            else:
+                print('\n'.join(wrapper.render_markup(thing_room_des)))
+            # Check to see if a task is associated with look operation. Features are looked up with their Room,
+            # Items wherever they are
+            room_id = current_room.room_id if kind == 2 else None
+            self.tasks.perform_task_on_look(room_id, item_or_feature, self.rooms_list, self.hero.time)
             # Hero time increment operation
             self.hero.time = self.hero.set_time()
         # not in the Room, but in the Inventory, print description
         elif thing_in_inven:
             'INVENTORY ITEM: '
-            self.print_output(thing_inven_des)
+            self.print_output(inven_item.description)
             # Check to see if a task is associated with look operation
-            self.tasks.perform_task_on_look(thing_inven_des, self.rooms_list, self.hero.time)
+            self.tasks.perform_task_on_look(None, inven_item, self.rooms_list, self.hero.time)
             # Hero time increment operation
             self.hero.time = self.hero.set_time()
         # not in the Room or the Inventory
         else:
             self.print_output('You do not see a {} in this room.'.format(thing))
+            return False
+
+        return True
 
     def save_game(self):
         """Saves the state of the Game to save files
@@ -309,51 +378,103 @@ class Game:
             room_file.write(room_data)
 
     def get_command(self):
-        """Get user input for interactions within the Game
+        """Get a line of user input and carry out the commands on it in order
 
-        :return: VOID
+        A line may hold several commands separated by ';', ',' or 'then'. Each is parsed just before it runs, so it
+        sees the room and inventory left by the one before. The first command that fails ends the turn. Everything
+        printed during the turn is held by the output sink and sent together with the next prompt.
+
+        :return: Outcome if a command ended the Game, None if the Game goes on
         """
-        current_room = self.rooms_list[self.hero.location]
+        # A choice offered by a Task is answered at the next prompt, before any other command
+        if self.tasks.choice is not None:
+            self.tasks.make_choice(input(self.tasks.get_choice_prompt()))
+            return self.get_outcome()
+
+        commands = self.parser.read_commands(self.rooms_list, self.hero, self.inventory)
 
-        # Check to determine if change needed to long_description for next game loop
-        self.tasks.perform_task_on_description(self.rooms_list, self.hero.location)
+        for position, text in enumerate(commands):
+            if position > 0:
+                print()
+
+            command = self.parser.parse_command(text, self.rooms_list, self.hero, self.inventory)
+            succeeded = self.run_command(command)
+
+            # Check day status after each command, unless the command ended the Game or is waiting on a choice
+            if self.get_outcome() is None and self.tasks.choice is None:
+                self.check_day()
+
+            outcome = self.get_outcome()
+            if outcome is not None:
+                return outcome
+
+            # The rest of the line waits until the choice has been made
+            if self.tasks.choice is not None:
+                break
+
+            if not succeeded:
+                break
+
+        return None
+
+    def get_outcome(self):
+        """Returns how the Game ended: by a Task playing an ending, or the player quitting
+
+        :return: Outcome, None while the Game is being played
+        """
+        if self.outcome is None:
+            self.outcome = self.tasks.outcome
+        return self.outcome
 
-        command = self.parser.parse_args(self.rooms_list, self.hero)
+    def run_command(self, command):
+        """Carry out one parsed command
 
-        if command[0] == 'move':
-            self.move(command[1])
-        elif command[0] == 'take':
-            self.take(command[1])
-        elif command[0] == 'inventory':
+        :param Command command: the parsed user input
+        :return: bool True if the command succeeded, False if it was invalid or could not be done
+        """
+        current_room = self.rooms_list[self.hero.location]
+
+        if not command.is_valid():
+            return False
+        elif command.verb == 'move':
+            return self.move(command.obj)
+        elif command.verb == 'take':
+            return self.take(command.obj)
+        elif command.verb == 'inventory':
             self.inventory.show_inventory()
-        elif command[0] == 'drop':
-            self.drop(command[1])
-        elif command[0] == 'look':
-            if len(command) == 1:
+        elif command.verb == 'drop':
+            return self.drop(command.obj)
+        elif command.verb == 'look':
+            if command.obj is None:
                 print()
-                processed = wrapper.wrap_processor(current_room.long_des)
+                processed = wrapper.render_markup(current_room.long_des)
                 for i in processed:
                     print(i)
                 # Hero time increment operation
                 self.hero.time = self.hero.set_time()
             else:
-                self.look_at_something(command[1])
-        elif command[0] == 'use':
-            self.use(command[1], command[2])
-        elif command[0] == 'map':
-            inventoryMapScreen.display(self.inventory, current_room.name, self.hero.location, self.rooms_list)
+                return self.look_at_something(command.obj)
+        elif command.verb == 'use':
+            return self.use(command.obj, command.target)
+        elif command.verb == 'map':
+            inventoryMapScreen.display(self.inventory, current_room.name, self.hero.location, self.rooms_list,
+                                       self.map_state)
             current_room.get_description()
-        elif command[0] == 'save':
+        elif command.verb == 'save':
             self.save_game()
+        elif command.verb == 'help':
+            self.parser.get_help(command.obj)
+        elif command.verb == 'exit':
+            self.outcome = Outcome.QUIT
 
-        elif command[0] == 'play' and command[1] == 'pool':
+        elif command.verb == 'play' and command.obj == 'pool':
             if current_room.name == 'Game Room':
                 self.play_pool()
             else:
-                print(' ' * 20 + "You can't do that here.")
+                print(layout.indent + "You can't do that here.")
+                return False
 
-        # Check day status on each iteration of the game loop
-        self.check_day()
+        return True
 
     def play_game(self, input_file, file_path, item_list):
         """Initializes the Game variables and starts the game-play
@@ -361,7 +482,27 @@ class Game:
         :param str input_file: main load file
         :param str file_path: path to the appropriate Rooms directory
         :param list item_list: list of starting Items
-        :return: Void
+        :return: Outcome of the Game
+        """
+        # Everything printed during the game is collected by the output sink. input(), and Task before it pauses or
+        # clears the screen, flush it, so each turn reaches the player in a single write. Only this thread's output goes
+        # to the sink, so Games in other threads or asyncio tasks keep their own
+        if self.output is None:
+            self.output = TerminalSink(sys.stdout)
+
+        with session_output(self.output):
+            try:
+                return self.run_game(input_file, file_path, item_list)
+            finally:
+                self.output.flush()
+
+    def run_game(self, input_file, file_path, item_list):
+        """Loads the Game and runs the game loop
+
+        :param str input_file: main load file
+        :param str file_path: path to the appropriate Rooms directory
+        :param list item_list: list of starting Items
+        :return: Outcome of the Game
         """
         game_file = open(input_file, 'r', encoding='utf-8')
         file_data = json.loads(game_file.read())
@@ -370,9 +511,17 @@ class Game:
         hero_data = file_data['hero']
         inventory_data = file_data['inventory']
 
+        # Start from a clean state, so a Game object can play one game after another
+        self.rooms_list = []
+        self.outcome = None
+        self.tasks = Task(cutscene_player=self.tasks.cutscene_player, output=self.output)
+        self.map_state = inventoryMapScreen.MapState()
+
         self.initialize_rooms(room_data, file_path)
+        inventoryMapScreen.update_flags(self.rooms_list, self.map_state)
         self.hero = Hero(hero_data['name'], hero_data['location'], hero_data['time'], hero_data['day'])
         self.inventory = Inventory(inventory_data)
+        inventoryMapScreen.reset_exploration(self.rooms_list, self.hero.location, self.map_state)
 
         room_iterator = 0
         current_room = self.rooms_list[0]
@@ -389,14 +538,16 @@ class Game:
         starting_room = self.rooms_list[self.hero.location]
         starting_room.get_description()
 
-        while 1:
-            self.get_command()
+        outcome = None
+        while outcome is None:
+            outcome = self.get_command()
+        return outcome
 
     def print_output(self, string):
         print()
-        wrappedText = textwrap.wrap(string, width=83)
+        wrappedText = textwrap.wrap(string, width=layout.print_width)
         for i in wrappedText:
-            print((' ' * 20) + i)
+            print(layout.indent + i)
 
     def check_day(self):
         # Check to see if new day. If not, a Null is returned. Else an integer corresponding to the day
@@ -407,12 +558,12 @@ class Game:
     def play_pool(self):
         rand_number = random.randint(0, 100) % 2
         if rand_number == 0:
-            print(' ' * 20 + "You size up the Poltergeist. You know you can take down this clown.\n")
-            print(' ' * 20 + "In a flurry of quick strikes, he promptly and decidedly beats you.\n")
-            print(' ' * 20 + "I don't lose. Better luck next try.")
+            print(layout.indent + "You size up the Poltergeist. You know you can take down this clown.\n")
+            print(layout.indent + "In a flurry of quick strikes, he promptly and decidedly beats you.\n")
+            print(layout.indent + "I don't lose. Better luck next try.")
         else:
-            print(' ' * 20 + "You're not sure if you can beat the Poltergeist at his own game.\n")
-            print(' ' * 20 + "Taking careful aim, you sink all of your balls without giving him a turn.")
-            print(' ' * 20 + "You sink the 8-ball! You've won!\n")
-            print(' ' * 20 + "The Polgergist is very unhappy. He breaks his cue against the pool table.")
-            print(' ' * 20 + "Perhaps you should consider leaving this room and let him cool off for a bit.")
+            print(layout.indent + "You're not sure if you can beat the Poltergeist at his own game.\n")
+            print(layout.indent + "Taking careful aim, you sink all of your balls without giving him a turn.")
+            print(layout.indent + "You sink the 8-ball! You've won!\n")
+            print(layout.indent + "The Polgergist is very unhappy. He breaks his cue against the pool table.")
+            print(layout.indent + "Perhaps you should consider leaving this room and let him cool off for a bit.")
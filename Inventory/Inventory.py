@@ -1,4 +1,6 @@
 from Item import Item
+from Layout import layout
+from NameIndex import NameIndex
 
 class Inventory:
     """ Class used to represent the Game Inventory
@@ -9,6 +11,8 @@ class Inventory:
         the maximum items the Inventory can hold
     items: list (of Item objects)
         holds the current Items in the Inventory
+    contents: NameIndex
+        the same Items, by name
 
     Methods:
     _______
@@ -34,10 +38,12 @@ class Inventory:
         :param list items: list of dictionary's containing Item information
         """
         self.items = []
+        self.contents = NameIndex()
         # go through each dict and initialize and Item adding it to the items list
         for i in items:
             new_item = Item(i['name'], i['description'], i['linkedFeature'])
             self.items.append(new_item)
+            self.contents.add(new_item.name, new_item)
 
     def space_available(self):
         if len(self.items) < self.capacity:
@@ -53,7 +59,8 @@ class Inventory:
         """
         # check that the Item can fit in the Inventory, add if possible
         self.items.append(item)
-        print('\n' + (' ' * 20) + '{} - added to your inventory.\n'.format(item.name), end='')
+        self.contents.add(item.name, item)
+        print('\n' + layout.indent + '{} - added to your inventory.\n'.format(item.name), end='')
 
 
     def remove_item(self, item):
@@ -65,6 +72,7 @@ class Inventory:
         # Remove any Item except the prybar which can be used multiple times
         if item.name != 'prybar':
             self.items.remove(item)
+            self.contents.remove(item.name, item)
 
     def in_inventory(self, str_input):
         """Check that an Item is in the items list and return the Item object
@@ -72,12 +80,11 @@ class Inventory:
         :param str str_input: the item being searched for
         :return: True if Item present and Item, False if Item not present and None
         """
-        for x in range(0, len(self.items)):
-            if self.items[x].name == str_input:
-                # return True, x
-                return True, self.items[x]
+        item = self.contents.first(str_input)
 
-        return False, None
+        if item is None:
+            return False, None
+        return True, item
 
     def key_in_inventory(self, str_input):
         """Check that a specific key Item is in the items list and return the key Item object
@@ -105,6 +112,7 @@ class Inventory:
         # if Item in inventory return success and the Item
         if status:
             self.items.remove(item)
+            self.contents.remove(item.name, item)
             success = True
             return success, item
         # Else success is fals and Item is None
@@ -117,18 +125,18 @@ class Inventory:
         :return: VOID
         """
         if len(self.items) > 0:
-            print('\n' + (' ' * 20) + 'These are the items in your inventory:\n')
+            print('\n' + layout.indent + 'These are the items in your inventory:\n')
             if len(self.items) == 1:
-                print((' ' * 20) + self.items[0].name)
+                print(layout.indent + self.items[0].name)
             elif len(self.items) == 2:
                 if self.items[1].name == 'shears' or self.items[1].name == 'ashes':
-                    print((' ' * 20) + self.items[0].name, end=' and ')
+                    print(layout.indent + self.items[0].name, end=' and ')
                     print(self.items[1].name)
                 else:
-                    print((' ' * 20) + self.items[0].name, end=' and a ')
+                    print(layout.indent + self.items[0].name, end=' and a ')
                     print(self.items[1].name)
             else:
-                print((' ' * 19), end=' ')
+                print(layout.indent[1:], end=' ')
                 for x in range(0, len(self.items)):
                     if x < (len(self.items) - 1):
                         print(self.items[x].name, end=', ')
@@ -138,7 +146,7 @@ class Inventory:
                         else:
                             print('and a ' + self.items[x].name)
         else:
-            print('\n' + (' ' * 20) + 'Your inventory is empty.')
+            print('\n' + layout.indent + 'Your inventory is empty.')
 
     def show_inventory_map_screen(self):
         """Displays the Items currently in the Inventory to map screen
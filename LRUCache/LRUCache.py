@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Class used to represent a bounded cache that evicts the least recently used entry
+
+    Attributes
+    ----------
+    capacity: int
+        the maximum number of entries held
+    hits: int
+        number of get() calls that found their key
+    misses: int
+        number of get() calls that did not find their key
+    entries: OrderedDict
+        the cached values, least recently used first
+
+    Methods
+    -------
+    get()
+        returns the value for a key (or a default) and records a hit or miss
+    put()
+        stores a value, evicting the oldest entry if the cache is full
+    clear()
+        removes every entry and resets the counters
+    hit_rate()
+        returns the fraction of get() calls that were hits
+    """
+
+    def __init__(self, capacity):
+        """Constructor for the LRUCache class
+
+        :param int capacity: the maximum number of entries to hold
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        """Gets the value stored for a key and marks it as most recently used
+
+        :param key: any hashable key
+        :param default: returned when the key is not cached
+        :return: the cached value or default
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """Stores a value, evicting the least recently used entry when full
+
+        :param key: any hashable key
+        :param value: the value to cache
+        :return: VOID
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """Removes every entry and resets the hit and miss counters
+
+        :return: VOID
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def hit_rate(self):
+        """Gets the fraction of lookups that were served from the cache
+
+        :return: float between 0 and 1 (0 if there have been no lookups)
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
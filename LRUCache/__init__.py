@@ -0,0 +1 @@
+from LRUCache.LRUCache import LRUCache
\ No newline at end of file
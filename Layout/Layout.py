@@ -0,0 +1,109 @@
+import shutil
+import signal
+import sys
+
+
+class Layout:
+    """Class used to represent the size of the screen and the widths the Game's text is laid out in
+
+    The Game was designed for a 125 x 50 terminal: text indented 20 columns, wrapped to 80 columns (83 for short
+    messages) between 85-column rules, with headings centered across all 125. On a narrower terminal the margin
+    shrinks first, then the text. Without a terminal (output piped, captured or sent over a socket) the design size
+    is used and never changes.
+
+    Attributes
+    ----------
+    columns: int
+        width of the screen
+    rows: int
+        height of the screen
+    headless: bool
+        True if there is no terminal to measure
+    margin: int
+        number of spaces before each line of text
+    indent: str
+        the margin as a string of spaces
+    rule_width: int
+        width of the rules drawn above and below descriptions
+    text_width: int
+        width descriptions are wrapped to, not counting the margin
+    print_width: int
+        width short messages are wrapped to, not counting the margin
+    version: int
+        incremented on every size change, so rendered text can tell it is out of date
+
+    Methods
+    -------
+    set_size()
+        sets the screen size and works out the widths from it
+    detect()
+        measures the terminal, or switches to headless mode if there isn't one
+    watch_resize()
+        re-measures the terminal whenever it is resized (SIGWINCH)
+    """
+    design_columns = 125
+    design_rows = 50
+    max_margin = 20
+    min_margin = 2
+    rule_columns = 85
+
+    def __init__(self, columns=design_columns, rows=design_rows, headless=True):
+        """Constructor for the Layout class
+
+        :param int columns: width of the screen
+        :param int rows: height of the screen
+        :param bool headless: True if there is no terminal
+        """
+        self.headless = headless
+        self.version = 0
+        self.set_size(columns, rows)
+
+    def set_size(self, columns, rows):
+        """Sets the screen size and works out the margin and widths for it
+
+        :param int columns: width of the screen
+        :param int rows: height of the screen
+        :return: VOID
+        """
+        self.columns = columns
+        self.rows = rows
+        self.margin = max(self.min_margin, min(self.max_margin, (columns - self.rule_columns) // 2))
+        self.indent = ' ' * self.margin
+        self.rule_width = max(20, min(self.rule_columns, columns - 2 * self.margin))
+        self.text_width = self.rule_width - 5
+        self.print_width = self.rule_width - 2
+        self.version += 1
+
+    def detect(self, stream=None):
+        """Measures the terminal the Game is shown in. If the stream isn't a terminal the design size is kept
+
+        :param file stream: the output stream, sys.stdout by default
+        :return: VOID
+        """
+        stream = stream or sys.stdout
+        self.headless = not stream.isatty()
+        if self.headless:
+            self.set_size(self.design_columns, self.design_rows)
+        else:
+            columns, rows = shutil.get_terminal_size((self.design_columns, self.design_rows))
+            self.set_size(columns, rows)
+
+    def watch_resize(self):
+        """Installs a SIGWINCH handler that re-measures the terminal when it is resized
+
+        :return: bool True if the handler was installed. Never in headless mode or where SIGWINCH doesn't exist
+        """
+        if self.headless or not hasattr(signal, 'SIGWINCH'):
+            return False
+
+        signal.signal(signal.SIGWINCH, self.on_resize)
+        return True
+
+    def on_resize(self, signum, frame):
+        columns, rows = shutil.get_terminal_size((self.columns, self.rows))
+        if (columns, rows) != (self.columns, self.rows):
+            self.set_size(columns, rows)
+
+
+# The layout shared by every part of the Game. Headless at the design size until main() detects the terminal
+layout = Layout()
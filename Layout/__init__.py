@@ -0,0 +1 @@
+from Layout.Layout import Layout, layout
\ No newline at end of file
@@ -0,0 +1,98 @@
+import itertools
+
+
+class NameIndex:
+    """Class used to find the Items and Features held by a Room or the Inventory by name
+
+    Attributes
+    ----------
+    entries: dict
+        key - name, value - list of the values stored under that name, in the order added
+    head_words: dict
+        key - last word of a name, value - set of names ending in that word ex: {'window': {'east window'}}
+    version: int
+        stamp that changes whenever a name is added or removed, unique across all NameIndexes (used as a cache key)
+
+    Methods
+    -------
+    add()
+        stores a value under a name
+    remove()
+        removes a value stored under a name
+    first()
+        returns the first value stored under a name
+    get_all()
+        returns every value stored under a name
+    resolve()
+        returns the full names a player's word could refer to
+    """
+    # Shared source of version stamps, so a stamp is never reused by another NameIndex
+    version_counter = itertools.count()
+
+    def __init__(self):
+        self.entries = {}
+        self.head_words = {}
+        self.version = next(NameIndex.version_counter)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def add(self, name, value):
+        """Stores a value under a name
+
+        :param str name: the name of an Item or Feature
+        :param value: the object (or tuple describing it) to store
+        :return: VOID
+        """
+        self.entries.setdefault(name, []).append(value)
+        self.head_words.setdefault(name.split()[-1], set()).add(name)
+        self.version = next(NameIndex.version_counter)
+
+    def remove(self, name, value):
+        """Removes a value stored under a name, forgetting the name once nothing is stored under it
+
+        :param str name: the name of an Item or Feature
+        :param value: the stored object (or tuple) to remove
+        :return: VOID
+        """
+        values = self.entries[name]
+        values.remove(value)
+
+        if not values:
+            del self.entries[name]
+            head = name.split()[-1]
+            self.head_words[head].discard(name)
+            if not self.head_words[head]:
+                del self.head_words[head]
+
+        self.version = next(NameIndex.version_counter)
+
+    def first(self, name):
+        """Gets the first value stored under a name
+
+        :param str name: the name of an Item or Feature
+        :return: the value, or None if nothing has that name
+        """
+        values = self.entries.get(name)
+        if values:
+            return values[0]
+        return None
+
+    def get_all(self, name):
+        """Gets every value stored under a name
+
+        :param str name: the name of an Item or Feature
+        :return: list of values (empty if nothing has that name)
+        """
+        return self.entries.get(name, [])
+
+    def resolve(self, word):
+        """Gets the full names a word could refer to: the word itself if something has exactly that name,
+        otherwise every name ending in that word ex: 'window' -> ['east window', 'west window']
+
+        :param str word: a name or the last word of a name
+        :return: sorted list of matching names (empty if none)
+        """
+        if word in self.entries:
+            return [word]
+        return sorted(self.head_words.get(word, ()))
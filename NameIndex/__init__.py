@@ -0,0 +1 @@
+from NameIndex.NameIndex import NameIndex
\ No newline at end of file
@@ -0,0 +1,24 @@
+from enum import Enum
+
+
+class Outcome(Enum):
+    """Class used to represent how a Game ended
+
+    Game.get_command() and Game.play_game() return one of these once the Game is over, and None while it is still
+    being played. A program running several Games can end just the one that finished and carry on with the others.
+
+    Attributes
+    ----------
+    won: bool
+        True for either of the winning endings
+    """
+    WON_A = 'won A'
+    WON_B = 'won B'
+    LOST_A = 'lost A'
+    LOST_B = 'lost B'
+    TIMED_OUT = 'timed out'
+    QUIT = 'quit'
+
+    @property
+    def won(self):
+        return self in (Outcome.WON_A, Outcome.WON_B)
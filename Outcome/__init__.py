@@ -0,0 +1 @@
+from Outcome.Outcome import Outcome
\ No newline at end of file
@@ -0,0 +1,242 @@
+import abc
+import contextlib
+import contextvars
+import io
+import sys
+import threading
+
+# The sink of the session running in the current thread or asyncio task. None outside of a session
+current_sink = contextvars.ContextVar('current_sink', default=None)
+
+# How highlighted words are shown: 'ansi' (terminal colors), 'plain' (no highlighting) or 'cues' (*asterisks*)
+COLOR_MODES = ('ansi', 'plain', 'cues')
+
+# Held while SessionStdout is put in place of sys.stdout, so sessions starting at the same time only install it once
+install_lock = threading.Lock()
+
+
+class OutputSink(io.StringIO, abc.ABC):
+    """Class used to collect the game's printed output and deliver it in one write
+
+    Install a sink with session_output(). print() calls only add to the buffer. flush() hands everything collected so
+    far to emit() in a single call. input() flushes stdout before it waits, so a turn's output and the next prompt
+    leave together. Subclasses decide where the text goes.
+
+    Attributes
+    ----------
+    color_mode: str
+        how the session's highlighted words are shown, one of COLOR_MODES
+    writes: int
+        number of times text was emitted
+
+    Methods
+    -------
+    flush()
+        emits everything collected so far and empties the buffer
+    emit()
+        delivers a block of text (implemented by subclasses)
+    """
+
+    def __new__(cls, *args, **kwargs):
+        # io.StringIO makes its objects in C, which skips the check object.__new__() does for abstract methods
+        if cls.__abstractmethods__:
+            raise TypeError("Can't instantiate abstract class {} with abstract method {}".format(
+                cls.__name__, ', '.join(sorted(cls.__abstractmethods__))))
+        return super().__new__(cls, *args, **kwargs)
+
+    def __init__(self, color_mode='ansi'):
+        """Constructor for the OutputSink class
+
+        :param str color_mode: 'ansi', 'plain' or 'cues'
+        """
+        super().__init__()
+        if color_mode not in COLOR_MODES:
+            raise ValueError('Unknown color mode: {}'.format(color_mode))
+        self.color_mode = color_mode
+        self.writes = 0
+
+    def flush(self):
+        """Emits the collected text, if there is any, and empties the buffer
+
+        :return: VOID
+        """
+        text = self.getvalue()
+        if text:
+            self.seek(0)
+            self.truncate()
+            self.emit(text)
+            self.writes += 1
+
+    @abc.abstractmethod
+    def emit(self, text):
+        """Delivers a block of text
+
+        :param str text: everything printed since the last flush
+        :return: VOID
+        """
+
+
+class TerminalSink(OutputSink):
+    """Class used to send collected output to a terminal or other text stream
+
+    fileno() and isatty() report the stream's own, so input() still sees a terminal and keeps readline editing and
+    tab-completion.
+
+    Attributes
+    ----------
+    stream: file
+        the text stream written to, usually sys.stdout
+    """
+
+    def __init__(self, stream, color_mode='ansi'):
+        """Constructor for the TerminalSink class
+
+        :param file stream: the text stream to write to
+        :param str color_mode: 'ansi', 'plain' or 'cues'
+        """
+        super().__init__(color_mode)
+        # Write to the real stream, not back through SessionStdout to this sink
+        if isinstance(stream, SessionStdout):
+            stream = stream.stream
+        self.stream = stream
+
+    def emit(self, text):
+        self.stream.write(text)
+        self.stream.flush()
+
+    def fileno(self):
+        return self.stream.fileno()
+
+    def isatty(self):
+        return self.stream.isatty()
+
+
+class MemorySink(OutputSink):
+    """Class used to capture output in memory, e.g. for tests or a frontend that renders the text itself
+
+    Attributes
+    ----------
+    blocks: list
+        each block of text emitted, in order
+    """
+
+    def __init__(self, color_mode='ansi'):
+        """Constructor for the MemorySink class
+
+        :param str color_mode: 'ansi', 'plain' or 'cues'
+        """
+        super().__init__(color_mode)
+        self.blocks = []
+
+    def emit(self, text):
+        self.blocks.append(text)
+
+    def get_output(self):
+        """Gets everything written so far, including text not yet flushed
+
+        :return: str
+        """
+        return ''.join(self.blocks) + self.getvalue()
+
+
+class SocketSink(OutputSink):
+    """Class used to send output to a network client
+
+    Attributes
+    ----------
+    connection: socket
+        the connected socket written to
+    encoding: str
+        the encoding the text is sent in
+    """
+
+    def __init__(self, connection, encoding='utf-8', color_mode='ansi'):
+        """Constructor for the SocketSink class
+
+        :param socket connection: a connected socket
+        :param str encoding: the encoding to send the text in
+        :param str color_mode: 'ansi', 'plain' or 'cues'
+        """
+        super().__init__(color_mode)
+        self.connection = connection
+        self.encoding = encoding
+
+    def emit(self, text):
+        self.connection.sendall(text.encode(self.encoding))
+
+
+class SessionStdout:
+    """Class used in place of sys.stdout, so several sessions can print at the same time
+
+    Each write goes to the sink of the session running in the current thread or asyncio task (current_sink), and
+    to the stream it replaced when there is no session. print() and input() need no changes to use a session's sink.
+
+    Attributes
+    ----------
+    stream: file
+        the stream sys.stdout was before, written to outside of a session
+
+    Methods
+    -------
+    get_target()
+        returns the current session's sink, or the stream if there is no session
+    """
+
+    def __init__(self, stream):
+        """Constructor for the SessionStdout class
+
+        :param file stream: the stream written to outside of a session
+        """
+        self.stream = stream
+
+    def get_target(self):
+        """Returns where a write made now goes
+
+        :return: file, the current session's sink or the stream
+        """
+        sink = current_sink.get()
+        return self.stream if sink is None else sink
+
+    def write(self, text):
+        return self.get_target().write(text)
+
+    def flush(self):
+        self.get_target().flush()
+
+    def fileno(self):
+        return self.get_target().fileno()
+
+    def isatty(self):
+        return self.get_target().isatty()
+
+    def __getattr__(self, name):
+        return getattr(self.get_target(), name)
+
+
+@contextlib.contextmanager
+def session_output(sink):
+    """Sends everything printed in the current thread or asyncio task to a sink until the block ends
+
+    SessionStdout is put in place of sys.stdout the first time. It is left there afterwards, since outside of a
+    session it writes to the stream it replaced
+
+    :param OutputSink sink: the session's sink
+    :return: VOID
+    """
+    with install_lock:
+        if not isinstance(sys.stdout, SessionStdout):
+            sys.stdout = SessionStdout(sys.stdout)
+
+    token = current_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        current_sink.reset(token)
+
+
+def get_color_mode():
+    """Returns the color mode of the session running in the current thread or asyncio task
+
+    :return: str, 'ansi' outside of a session or for a sink without a color mode
+    """
+    return getattr(current_sink.get(), 'color_mode', 'ansi')
@@ -0,0 +1,2 @@
+from OutputSink.OutputSink import OutputSink, TerminalSink, MemorySink, SocketSink, SessionStdout, session_output, \
+    get_color_mode
\ No newline at end of file
@@ -1,6 +1,9 @@
+import itertools
 import textwrap
 from Feature import Feature
 from Item import Item
+from Layout import layout
+from NameIndex import NameIndex
 from Wrapper import wrapper
 
 class Room:
@@ -12,6 +15,8 @@ class Room:
         the name of the Room
     long_des: str
         the long description of the Room
+    next_long_des: str
+        long description that replaces long_des once it has been shown, None if there is none
     short_des: str
         the short description of the Room
     visited: bool
@@ -24,6 +29,20 @@ class Room:
         Items the player has dropped in the Room
     starting_items: list (of Item objects)
         Items that are initialized in the Room
+    features: list (of Feature objects)
+        Features of the Room, indexed by feature_id
+    contents: NameIndex
+        every starting Item, dropped Item and Feature by name, stored as ('starting' | 'dropped' | 'feature', object)
+    exit_aliases: dict
+        cache of every accepted exit name to its direction, None until built
+    directions_version: int
+        stamp that changes whenever the exits change, unique across all Rooms (used as a cache key)
+    header: str
+        the rule and location heading printed above the description, None until compiled
+    header_version: int
+        the Layout version the header was built for
+    rendered: dict
+        key - description attribute name, value - (hash of the text, wrapped and colorized text)
 
     Methods
     -------
@@ -43,18 +62,29 @@ class Room:
         removes the Item from the starting_items or dropped_items lists
     leave_item()
         adds an Item to the dropped_items list
+    compile_descriptions()
+        wraps and colorizes the heading and every description ahead of time
+    get_rule()
+        returns the line drawn above and below the description
     get_description()
         returns the description of the Feature or Item called
+    add_direction()
+        adds an exit to the Room and discards the cached exit aliases
+    get_exit_aliases()
+        returns the cached dict of accepted exit names to directions
     set_visited()
         sets the visited bool to True
     save_room()
         formats the Room into a dict representation for saving
     """
+    # Shared source of directions_version stamps, so a stamp is never reused by another Room
+    version_counter = itertools.count()
 
     def __repr__(self):
         return self
 
-    def __init__(self, name, long_des, short_des, visited, room_id, directions, s_items, d_items, feats):
+    def __init__(self, name, long_des, short_des, visited, room_id, directions, s_items, d_items, feats,
+                 next_long_des=None):
         """Constructor for the Room class
 
         :param str name: name of the Room
@@ -66,16 +96,24 @@ class Room:
         :param list s_items: list of starting Items
         :param list d_items: list of dropped Items
         :param list feats: list of Room Features
+        :param str next_long_des: long description to use after long_des has been shown once
         """
         self.name = name
         self.long_des = long_des
+        self.next_long_des = next_long_des
         self.short_des = short_des
         self.visited = visited
         self.room_id = room_id
         self.directions = directions.copy()
+        self.exit_aliases = None
+        self.directions_version = next(Room.version_counter)
         self.starting_items = []
         self.dropped_items = []
         self.features = []
+        self.contents = NameIndex()
+        self.header = None
+        self.header_version = None
+        self.rendered = {}
 
         # call this to get the information from the passed in list to the local lists
         self.generate_lists(s_items, d_items, feats)
@@ -92,10 +130,12 @@ class Room:
         for s in s_items:
             new_s_item = Item(s['name'], s['description'], s['linkedFeature'])
             self.starting_items.append(new_s_item)
+            self.contents.add(new_s_item.name, ('starting', new_s_item))
 
         for d in d_items:
             new_d_item = Item(d['name'], d['description'], d['linkedFeature'])
             self.dropped_items.append(new_d_item)
+            self.contents.add(new_d_item.name, ('dropped', new_d_item))
 
         for f in feats:
             new_feat = Feature(
@@ -109,6 +149,7 @@ class Room:
                 f['featureId']
             )
             self.features.insert(new_feat.feature_id, new_feat)
+            self.contents.add(new_feat.name, ('feature', new_feat))
 
     def get_feature(self, name):
         """Gets a Feature by its name (Feature.name)
@@ -116,8 +157,8 @@ class Room:
         :param str name: name of Feature
         :return: True/Feature if Feature present, False/None if not present
         """
-        for feat in self.features:
-            if feat.name == name:
+        for kind, feat in self.contents.get_all(name):
+            if kind == 'feature':
                 return True, feat
 
         return False, None
@@ -128,17 +169,15 @@ class Room:
         :param str str_input: a user input of a Feature or Item name
         :return: int - representing Item or Feature and the Item, False/None if no Item or Feature
         """
-        for i in self.starting_items:
-            if str_input == i.name:
-                return 1, i
-        for j in self.dropped_items:
-            if str_input == j.name:
-                return 1, j
-        for k in self.features:
-            if str_input == k.name:
-                return 2, k
+        found = self.contents.first(str_input)
 
-        return False, None
+        if found is None:
+            return False, None
+
+        kind, item_or_feature = found
+        if kind == 'feature':
+            return 2, item_or_feature
+        return 1, item_or_feature
 
     def look_in_room(self, str_input):
         """Gets the description of an Item or Feature if it is in a Room
@@ -182,13 +221,11 @@ class Room:
         :param str str_input: user input of the name of an Item in the Room
         :return: Int representing starting/dropped Item and Item or None
         """
-        for x in self.starting_items:
-            if x.name == str_input:
-                return 1, x
-
-        for y in self.dropped_items:
-            if y.name == str_input:
-                return 2, y
+        for kind, item in self.contents.get_all(str_input):
+            if kind == 'starting':
+                return 1, item
+            elif kind == 'dropped':
+                return 2, item
 
         return 3, None
 
@@ -208,10 +245,12 @@ class Room:
             self.features[item.linked_feature].state = 3
             item.linked_feature = None
             self.starting_items.remove(item)
+            self.contents.remove(item.name, ('starting', item))
             return True, item
         # status 2 means this was a dropped item
         elif status == 2:
             self.dropped_items.remove(item)
+            self.contents.remove(item.name, ('dropped', item))
             return True, item
         # anything else means the item is not here
         else:
@@ -224,48 +263,85 @@ class Room:
         :return: VOID
         """
         self.dropped_items.append(item)
+        self.contents.add(item.name, ('dropped', item))
+
+    def compile_descriptions(self):
+        """Wraps and colorizes the Room heading and descriptions, and those of its Features, ahead of time
+
+        :return: VOID
+        """
+        center_left_right = layout.columns
+        self.header = '\n{}\n\n{}\n'.format(self.get_rule(), 'CURRENT LOCATION: {}\n'.format(self.name).center(center_left_right))
+        self.header_version = layout.version
+
+        wrapper.render_field(self, 'long_des')
+        wrapper.render_field(self, 'short_des')
+        for feature in self.features:
+            feature.compile_descriptions()
 
     def get_description(self):
         """Formats and prints the current description of the Room
 
         :return: VOID
         """
-        center_left_right = 125
-        print()
-        print((' ' * 20) + ('▃' * 85) + '\n')
-        print('CURRENT LOCATION: {}\n'.format(self.name).center(center_left_right))
+        # Compile on first use, and again after the terminal has been resized
+        if self.header_version != layout.version:
+            self.compile_descriptions()
 
-        # If not visited, check for newlines and output long description
+        # If not visited output the long description, else player has visited before, output short description.
+        # Both were wrapped when the Room was compiled, and are only wrapped again if a Task has changed them
         if not self.visited:
-
-            # Check for newlines & bold or character signifiers
-            if ('\n' in self.long_des) or ('@' in self.long_des) or ('^' in self.long_des) or ('$' in self.long_des) or ('~' in self.long_des) or ('#' in self.long_des):
-                processed = wrapper.wrap_processor(self.long_des)
-                for i in processed:
-                    print(i)
-
-            # Else no newlines or bold color signifiers. Simple processing.
-            else:
-                print(textwrap.fill('{}'.format(self.long_des), 100, initial_indent=(' ' * 20), subsequent_indent=(' ' * 20)))
-        # Else player has visited before, output short description
+            description = wrapper.render_field(self, 'long_des')
+            # A vision or first impression is only seen once. Its follow-up description is used from now on
+            if self.next_long_des is not None:
+                self.long_des = self.next_long_des
+                self.next_long_des = None
         else:
-            # Check for newlines & bold or character signifiers
-            if ('\n' in self.short_des) or ('@' in self.short_des) or ('^' in self.short_des) or ('$' in self.short_des) or ('~' in self.long_des) or ('#' in self.short_des):
-                processed = wrapper.wrap_processor(self.short_des)
-                for i in processed:
-                    print(i)
-
-            # Else no newlines or bold color signifiers. Simple processing.
-            else:
-                print(textwrap.fill('{}'.format(self.short_des), 100, initial_indent=(' ' * 20), subsequent_indent=(' ' * 20)))
+            description = wrapper.render_field(self, 'short_des')
 
-        print()
-        print()
+        output = [self.header, description, '\n\n\n']
         if len(self.dropped_items) > 0:
-            print(textwrap.fill('You seem to have left these items on the floor: ', initial_indent=(' ' * 20)))
+            output.append(textwrap.fill('You seem to have left these items on the floor: ', initial_indent=layout.indent) + '\n')
             for y in range(0, len(self.dropped_items)):
-                print(textwrap.fill('\t{}'.format(self.dropped_items[y].name), initial_indent=(' ' * 18)))
-        print((' ' * 20) + ('▃' * 85) + '\n')
+                output.append(textwrap.fill('\t{}'.format(self.dropped_items[y].name), initial_indent=layout.indent[2:]) + '\n')
+        output.append(self.get_rule() + '\n\n')
+
+        print(''.join(output), end='')
+
+    def get_rule(self):
+        """Gets the line drawn above and below the description, sized to the Layout
+
+        :return: str
+        """
+        return layout.indent + ('▃' * layout.rule_width)
+
+    def add_direction(self, direction, room_id):
+        """Adds (or replaces) an exit and throws away the cached exit aliases
+
+        :param str direction: the direction of the exit ex: 'down'
+        :param int room_id: index of the Room the exit leads to
+        :return: VOID
+        """
+        self.directions[direction] = room_id
+        self.exit_aliases = None
+        self.directions_version = next(Room.version_counter)
+
+    def get_exit_aliases(self, rooms_list):
+        """Gets a dict mapping each direction and lowercased neighbouring Room name to the direction
+
+        The dict is built on first use and kept until add_direction() changes the exits
+
+        :param list rooms_list: the Game.rooms_list, used to look up neighbouring Room names
+        :return: dict ex: {'north': 'north', 'dining room': 'north'}
+        """
+        if self.exit_aliases is None:
+            aliases = {}
+            for direction, room_id in self.directions.items():
+                aliases[direction] = direction
+                aliases.setdefault(rooms_list[room_id].name.lower(), direction)
+            self.exit_aliases = aliases
+
+        return self.exit_aliases
 
     def set_visited(self):
         """Sets the state of the Room to visited
@@ -283,6 +359,7 @@ class Room:
             'name': self.name,
             'longDes': self.long_des,
             'shortDes': self.short_des,
+            'nextLongDes': self.next_long_des,
             'visited': self.visited,
             'startingItems': [],
             'droppedItems': [],
@@ -0,0 +1,151 @@
+import sys
+
+try:
+    import curses
+except ImportError:
+    # curses isn't available on every platform (e.g. Windows). The ANSI sequences below are used instead
+    curses = None
+
+
+class Terminal:
+    """Class used to control the terminal directly, without starting a program such as clear
+
+    Each sequence is looked up in the terminal's terminfo entry the first time it is needed and kept, so the lookup
+    happens once per session. Where there is no terminfo entry (or no curses) the ANSI sequence is used. A headless
+    Terminal (output piped, captured or sent over a socket) has no screen to control, so every sequence is empty and
+    every method does nothing. Colors aren't the Terminal's concern: the color mode (plain or cues) only changes how
+    highlighted words are written, so the screen is still cleared and the cursor moved in those modes.
+
+    Attributes
+    ----------
+    headless: bool
+        True if there is no terminal to control
+    terminfo: bool
+        True once the terminal's terminfo entry has been read
+    sequences: dict
+        key - sequence name, value - the terminfo capability string (not yet filled in for parameters)
+
+    Methods
+    -------
+    detect()
+        checks whether the output is a terminal and, if so, reads its terminfo entry
+    get_capability()
+        returns a sequence's capability string, looked up once
+    sequence()
+        returns the text of a terminal command, filled in with its parameters
+    clear()
+        clears the screen and moves the cursor to the top left corner
+    write()
+        writes a terminal command to the output
+    """
+    # Sequence name to its terminfo capability name and the ANSI sequence used when there is no terminfo entry. The
+    # ANSI sequences with a parameter are in terminfo form (%p1%d is the parameter, %i makes it count from one)
+    capabilities = {
+        'clear': ('clear', '\033[H\033[2J'),
+        'cursor_up': ('cuu', '\033[%p1%dA'),
+        'column': ('hpa', '\033[%i%p1%dG'),
+        'save_cursor': ('sc', '\0337'),
+        'restore_cursor': ('rc', '\0338'),
+        'erase_line': ('el', '\033[K'),
+    }
+
+    def __init__(self, headless=True):
+        """Constructor for the Terminal class
+
+        :param bool headless: True if there is no terminal
+        """
+        self.headless = headless
+        self.sequences = {}
+        self.terminfo = False
+
+    def detect(self, stream=None):
+        """Checks whether the Game's output is a terminal, and reads the terminal's terminfo entry if it is
+
+        :param file stream: the output stream, sys.stdout by default
+        :return: VOID
+        """
+        stream = stream or sys.stdout
+        self.headless = not stream.isatty()
+        self.sequences = {}
+        self.terminfo = False
+
+        if not self.headless and curses is not None:
+            try:
+                curses.setupterm(fd=stream.fileno())
+                self.terminfo = True
+            except (curses.error, OSError, ValueError):
+                # No terminfo entry for $TERM. The ANSI sequences are used
+                pass
+
+    def get_capability(self, name):
+        """Returns a sequence's capability string, looking it up the first time it is asked for
+
+        :param str name: sequence name, one of Terminal.capabilities
+        :return: str
+        """
+        capability = self.sequences.get(name)
+        if capability is None:
+            capname, capability = self.capabilities[name]
+            if self.terminfo:
+                found = curses.tigetstr(capname)
+                if found:
+                    capability = found.decode('latin-1')
+            self.sequences[name] = capability
+        return capability
+
+    def sequence(self, name, *params):
+        """Returns the text of a terminal command
+
+        :param str name: sequence name ex: 'cursor_up'
+        :param int params: the command's parameters ex: the number of lines to move
+        :return: str, empty when headless
+        """
+        if self.headless:
+            return ''
+
+        capability = self.get_capability(name)
+        if not params:
+            return capability
+        if self.terminfo:
+            return curses.tparm(capability.encode('latin-1'), *params).decode('latin-1')
+        return fill_parameters(capability, params)
+
+    def clear(self):
+        """Shows everything printed so far, then clears the screen
+
+        :return: VOID
+        """
+        sys.stdout.flush()
+        self.write('clear')
+        sys.stdout.flush()
+
+    def write(self, name, *params):
+        """Writes a terminal command to the output
+
+        :param str name: sequence name ex: 'erase_line'
+        :param int params: the command's parameters
+        :return: VOID
+        """
+        text = self.sequence(name, *params)
+        if text:
+            sys.stdout.write(text)
+
+
+def fill_parameters(capability, params):
+    """Fills in the parameters of one of the fallback ANSI sequences
+
+    Only the two codes the fallbacks use are handled: %i (count from one) and %p1%d (the first parameter)
+
+    :param str capability: sequence in terminfo form
+    :param tuple params: the parameters
+    :return: str
+    """
+    value = params[0]
+    if '%i' in capability:
+        value += 1
+        capability = capability.replace('%i', '')
+    return capability.replace('%p1%d', str(value))
+
+
+# The terminal shared by every part of the Game. Headless until main() detects the terminal
+terminal = Terminal()
@@ -0,0 +1 @@
+from Terminal.Terminal import Terminal, terminal
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""Compares wrap_processor with the original quadratic version it replaced
+
+Run from the project root:
+
+    python -m Wrapper.benchmark [number of texts] [repeats]
+
+Every string in dataStore/, in the Task tables and in Task/Task.py is rendered by both versions and the results are checked to be
+identical. The longest texts are then timed with each version.
+"""
+import ast
+import glob
+import json
+import os
+import sys
+import timeit
+from Wrapper import wrapper
+
+# The project root, so the texts are found wherever this is run from
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def legacy_wrap_processor(string):
+    """The original wrap_processor, kept unchanged for comparison
+
+    :param string: String for wrapping
+    :return: Array containing wrapped strings
+    """
+    # Establish variables for use in processing
+    wrapped = ''
+    list_for_processing = []
+    counter = 0
+    width = 80
+
+    mid_processing_list = []
+
+    # If newline, split lines and process
+    if '\n' in string:
+        splitLinesList = string.splitlines()
+
+        for x in splitLinesList:
+            # Split each by word and process
+            list_for_processing = x.split()
+            wrapped = '                    '
+            counter = 0
+            for word in range(0, len(list_for_processing)):
+                if counter + len(list_for_processing[word]) + 1 <= width:
+                    wrapped = wrapped + list_for_processing[word] + ' '
+                    counter = counter + len(list_for_processing[word]) + 1
+                else:
+                    wrapped = wrapped + '\n' + '                    ' + list_for_processing[word] + ' '
+                    counter = len(list_for_processing[word])
+            mid_processing_list.append(wrapped)
+
+    # Else, process a string without newlines
+    else:
+        list_for_processing = string.split()
+        wrapped = '                    '
+        counter = 0
+        for word in range(0, len(list_for_processing)):
+            if counter + len(list_for_processing[word]) + 1 <= width:
+                wrapped = wrapped + list_for_processing[word] + ' '
+                counter = counter + len(list_for_processing[word]) + 1
+            else:
+                wrapped = wrapped + '\n' + '                    ' + list_for_processing[word] + ' '
+                counter = len(list_for_processing[word])
+        mid_processing_list.append(wrapped)
+
+    # Perform character substitution, replacing special marker characters with terminal commands
+    final_list = []
+    final_string = ''
+    for x in mid_processing_list:
+        for z in x:
+            if z == '@':
+                new_char = '\033[1;31m'
+            elif z == '^':
+                new_char = '\033[1;35m'
+            elif z == '$':
+                new_char = '\033[1;36m'
+            elif z == '~':
+                new_char = '\033[1;33m'
+            elif z == '#':
+                new_char = '\033[0m'
+            else:
+                new_char = z
+            final_string = final_string + new_char
+        final_list.append(final_string)
+        final_string = ''
+
+    return final_list
+
+
+def collect_strings(value):
+    """Yields every string held anywhere in a loaded JSON value
+
+    :param value: dict, list or scalar from json.load()
+    :return: generator of str
+    """
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from collect_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from collect_strings(item)
+
+
+def load_texts():
+    """Gathers the game's text from the room files, the rule and ending tables and the string literals in Task.py
+
+    :return: list of unique strings, longest first
+    """
+    texts = set()
+
+    paths = glob.glob(os.path.join(ROOT, 'dataStore', '**', '*.json'), recursive=True)
+    paths += glob.glob(os.path.join(ROOT, 'Task', '*.json'))
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as data_file:
+            texts.update(collect_strings(json.load(data_file)))
+
+    with open(os.path.join(ROOT, 'Task', 'Task.py'), 'r', encoding='utf-8') as task_file:
+        for node in ast.walk(ast.parse(task_file.read())):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                texts.add(node.value)
+
+    return sorted(texts, key=len, reverse=True)
+
+
+def main(count=10, repeats=200):
+    texts = load_texts()
+
+    mismatches = [text for text in texts if wrapper.wrap_processor(text) != legacy_wrap_processor(text)]
+    print('{} texts compared, {} differ'.format(len(texts), len(mismatches)))
+    for text in mismatches:
+        print('    differs: {!r}'.format(text[:60]))
+
+    print()
+    print('{:>7}  {:>12}  {:>12}  {:>8}'.format('length', 'legacy (us)', 'current (us)', 'speedup'))
+    for text in texts[:count]:
+        legacy = timeit.timeit(lambda: legacy_wrap_processor(text), number=repeats) / repeats * 1e6
+        current = timeit.timeit(lambda: wrapper.wrap_processor(text), number=repeats) / repeats * 1e6
+        print('{:>7}  {:>12.1f}  {:>12.1f}  {:>7.1f}x'.format(len(text), legacy, current, legacy / current))
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*[int(arg) for arg in sys.argv[1:3]]))
@@ -1,85 +1,249 @@
-def wrap_processor(string):
+import textwrap
+from Layout import layout
+from LRUCache import LRUCache
+from OutputSink import get_color_mode
+
+# Left margin and width of the wrapped text at the Game's design size (125 columns). The current sizes come from
+# Layout.layout
+INDENT = ' ' * 20
+WIDTH = 80
+
+# Marker characters used in descriptions, and the terminal command each one is replaced with
+MARKUP = (
+    ('@', '\033[1;31m'),  # Bold Red Text for Items
+    ('^', '\033[1;35m'),  # Bold Purple Text for Features
+    ('$', '\033[1;36m'),  # Bold Cyan Text for Directions
+    ('~', '\033[1;33m'),  # Bold Yellow Text for End Game Hints
+    ('#', '\033[0m'),     # End terminal command, reset to normal
+)
+
+# Replacements for each color mode (the session's OutputSink.color_mode). 'plain' removes the markers, 'cues' marks
+# the highlighted words with asterisks, so neither ever produces escape sequences
+MARKUP_TABLES = {
+    'ansi': MARKUP,
+    'plain': tuple((marker, '') for marker, replacement in MARKUP),
+    'cues': tuple((marker, '*') for marker, replacement in MARKUP),
+}
+
+
+# Characters that mean a text has to go through wrap_processor rather than textwrap
+SPECIAL_CHARACTERS = ('\n',) + tuple(marker for marker, replacement in MARKUP)
+
+# Maximum number of rendered texts kept in render_cache, and of split texts kept in token_cache
+RENDER_CACHE_SIZE = 256
+
+# Rendered lines keyed by (text, width, margin, color mode). The color mode is the session's for wrap_processor output
+# and None for plain textwrap output, so sessions in different modes share the cache without mixing their text.
+# render_cache.hits and render_cache.misses show how often rendering was skipped
+render_cache = LRUCache(RENDER_CACHE_SIZE)
+
+# The words (or textwrap chunks) of each text, keyed by (text, 'markup' | 'fill'). Splitting a text doesn't depend on
+# the width, so after a resize the text is re-flowed from here instead of being split again
+token_cache = LRUCache(RENDER_CACHE_SIZE)
+
+class ChunkWrapper(textwrap.TextWrapper):
+    """TextWrapper that splits a text into chunks and fills lines from chunks as two separate steps
+
+    fill() does both at once, so the chunks of a text can't be kept and re-flowed at another width. The two halves
+    of fill() are only available as undocumented TextWrapper methods, so this class is the one place that uses them.
+    tests/test_wrapper.py checks the result against textwrap.fill() over the Game's text, so a change to those methods
+    in a new Python release shows up there
+    """
+
+    def split_chunks(self, text):
+        """Splits a text into the chunks fill() would wrap. The width doesn't matter
+
+        :param text: String for wrapping
+        :return: Tuple of chunks
+        """
+        return tuple(self._split_chunks(text))
+
+    def fill_chunks(self, chunks):
+        """Fills lines from chunks made by split_chunks(), as fill() does
+
+        :param chunks: Sequence of chunks
+        :return: String of the lines joined by newlines
+        """
+        return '\n'.join(self._wrap_chunks(list(chunks)))
+
+
+# Splits texts into chunks. Only its chunking is used, so the width doesn't matter
+chunker = ChunkWrapper()
+
+
+def render(string, width=None, indent=None, color_mode=None):
+    """Returns the display lines for a description, rendering it only the first time it is shown at this size
+
+    Texts with newlines or marker characters go through wrap_processor. Anything else is filled by textwrap
+
+    :param string: String for wrapping
+    :param width: Width of the text, not counting the margin. Defaults to layout.text_width
+    :param indent: Left margin of every line. Defaults to layout.indent
+    :param color_mode: 'ansi', 'plain' or 'cues'. Defaults to the current session's
+    :return: Tuple of lines ready to print. Shared with the cache, so it must not be changed
+    """
+    width = layout.text_width if width is None else width
+    indent = layout.indent if indent is None else indent
+
+    if any(character in string for character in SPECIAL_CHARACTERS):
+        return render_markup(string, width, indent, color_mode)
+
+    key = (string, width, len(indent), None)
+    lines = render_cache.get(key)
+    if lines is None:
+        filler = ChunkWrapper(width + len(indent), initial_indent=indent, subsequent_indent=indent)
+        # The second half of fill(), after the chunking that token_cache has already done
+        lines = (filler.fill_chunks(get_tokens(string, 'fill')),)
+        render_cache.put(key, lines)
+    return lines
+
+
+def render_field(obj, field, markup=False, color_mode=None):
+    """Returns one of an object's description fields as a block of text ready to print
+
+    The block is kept in obj.rendered with the hash of the text it was made from, the layout version and the color
+    mode. Assigning a new text to the field (as Task does) changes the hash, so only that field is rendered again, the
+    next time it is shown. A terminal resize changes the layout version, so every field is re-flowed when next shown
+
+    :param obj: Room or Feature with a rendered dict
+    :param field: Name of the description attribute ex: 'long_des'
+    :param markup: True to always use wrap_processor, False to choose the same way as render()
+    :param color_mode: 'ansi', 'plain' or 'cues'. Defaults to the current session's
+    :return: String of the wrapped lines joined by newlines
+    """
+    color_mode = get_color_mode() if color_mode is None else color_mode
+    text = getattr(obj, field)
+    stamp = (hash(text), layout.version, color_mode)
+    compiled = obj.rendered.get(field)
+
+    if compiled is None or compiled[0] != stamp:
+        lines = render_markup(text, color_mode=color_mode) if markup else render(text, color_mode=color_mode)
+        compiled = (stamp, '\n'.join(lines))
+        obj.rendered[field] = compiled
+
+    return compiled[1]
+
+
+def render_markup(string, width=None, indent=None, color_mode=None):
+    """Returns wrap_processor's lines for a text, from render_cache when it has been rendered at this size before
+
+    :param string: String for wrapping
+    :param width: Width of the text, not counting the margin. Defaults to layout.text_width
+    :param indent: Left margin of every line. Defaults to layout.indent
+    :param color_mode: 'ansi', 'plain' or 'cues'. Defaults to the current session's
+    :return: Tuple of lines ready to print. Shared with the cache, so it must not be changed
+    """
+    width = layout.text_width if width is None else width
+    indent = layout.indent if indent is None else indent
+    color_mode = get_color_mode() if color_mode is None else color_mode
+
+    key = (string, width, len(indent), color_mode)
+    lines = render_cache.get(key)
+    if lines is None:
+        table = MARKUP_TABLES[color_mode]
+        lines = tuple(apply_markup(wrap_words(words, width, indent), table) for words in get_tokens(string, 'markup'))
+        render_cache.put(key, lines)
+    return lines
+
+
+def get_tokens(string, kind):
+    """Splits a text for wrapping, or returns the split kept from an earlier call
+
+    :param string: String for wrapping
+    :param kind: 'markup' for wrap_processor (a tuple of words per line) or 'fill' for textwrap (a tuple of chunks)
+    :return: Tuple of tokens
+    """
+    key = (string, kind)
+    tokens = token_cache.get(key)
+    if tokens is None:
+        if kind == 'fill':
+            tokens = chunker.split_chunks(string)
+        else:
+            tokens = tuple(tuple(line.split()) for line in split_lines(string))
+        token_cache.put(key, tokens)
+    return tokens
+
+
+def split_lines(string):
+    """Splits a text into the lines wrap_processor wraps separately
+
+    :param string: String for wrapping
+    :return: List of lines
+    """
+    # If newline, split lines and process each one. Else, process the string as a single line
+    if '\n' in string:
+        return string.splitlines()
+    return [string]
+
+
+def wrap_processor(string, width=None, indent=None, color_mode=None):
     """Processes input string and outputs wrapped as TextWrapper does, without stripping special chars
 
     :param string: String for wrapping
+    :param width: Width of the text, not counting the margin. Defaults to layout.text_width
+    :param indent: Left margin of every line. Defaults to layout.indent
+    :param color_mode: 'ansi', 'plain' or 'cues'. Defaults to the current session's
     :return: Array containing wrapped strings
     """
-    # Establish variables for use in processing
-    wrapped = ''
-    list_for_processing = []
+    width = layout.text_width if width is None else width
+    indent = layout.indent if indent is None else indent
+    table = MARKUP_TABLES[get_color_mode() if color_mode is None else color_mode]
+
+    # Wrap each line, then replace the special marker characters with terminal commands
+    return [apply_markup(wrap_line(line, width, indent), table) for line in split_lines(string)]
+
+
+def apply_markup(text, table=None):
+    """Replaces each marker character with its terminal command, or with the text for the session's color mode
+
+    str.replace() runs in C, so one pass per marker is far quicker than str.translate(), which falls back to a
+    per-character lookup when characters are replaced by longer strings
+
+    :param text: String containing marker characters
+    :param table: Pairs of (marker, replacement) from MARKUP_TABLES. Defaults to the table for the current session's
+    color mode
+    :return: String with the markers replaced
+    """
+    if table is None:
+        table = MARKUP_TABLES[get_color_mode()]
+    for marker, replacement in table:
+        text = text.replace(marker, replacement)
+    return text
+
+
+def wrap_line(line, width=WIDTH, indent=INDENT):
+    """Wraps one line of text to width, indenting every row. Marker characters count towards the width
+
+    :param line: String without newlines
+    :param width: Width of the text, not counting the margin
+    :param indent: Left margin of every row
+    :return: String holding the indented rows, separated by newlines. Every word is followed by a space
+    """
+    return wrap_words(line.split(), width, indent)
+
+
+def wrap_words(words, width=WIDTH, indent=INDENT):
+    """Wraps a line's words to width, indenting every row
+
+    The following is adapted from a post on:
+    https://stackoverflow.com/questions/16430200/a-good-way-to-make-long-strings-wrap-to-newline
+
+    :param words: Sequence of the words of one line
+    :param width: Width of the text, not counting the margin
+    :param indent: Left margin of every row
+    :return: String holding the indented rows, separated by newlines. Every word is followed by a space
+    """
+    pieces = [indent]
     counter = 0
-    width = 80
 
-    mid_processing_list = []
+    for word in words:
+        # If the current word is of length that can be added to the current line, within width limit
+        if counter + len(word) + 1 <= width:
+            pieces.append(word + ' ')
+            counter = counter + len(word) + 1
+        else:
+            # Start a new row with the word in question. The row's counter doesn't include its trailing space
+            pieces.append('\n' + indent + word + ' ')
+            counter = len(word)
 
-    # If newline, split lines and process
-    if '\n' in string:
-        splitLinesList = string.splitlines()
-
-        # For each line in array. The following is adapted from a post on
-        # https://stackoverflow.com/questions/16430200/a-good-way-to-make-long-strings-wrap-to-newline
-        for x in splitLinesList:
-            # Split each by word and process
-            list_for_processing = x.split()
-            wrapped = '                    '
-            counter = 0
-            for word in range(0, len(list_for_processing)):
-                # If the current word is of length that can be added to the current line, within width limit
-                if counter + len(list_for_processing[word]) + 1 <= width:
-                    # Add the word to the wrapped string
-                    wrapped = wrapped + list_for_processing[word] + ' '
-                    # Increment the counter
-                    counter = counter + len(list_for_processing[word]) + 1
-                else:
-                    wrapped = wrapped + '\n' + '                    ' + list_for_processing[word] + ' '
-                    counter = len(list_for_processing[word])
-            mid_processing_list.append(wrapped)
-
-    # Else, process a string without newlines
-    # The following is adapted from a post on:
-    # https://stackoverflow.com/questions/16430200/a-good-way-to-make-long-strings-wrap-to-newline
-    else:
-        list_for_processing = string.split()
-        wrapped = '                    '
-        counter = 0
-        for word in range(0, len(list_for_processing)):
-            # If the current word is of length that can be added to the current line, within width limit
-            if counter + len(list_for_processing[word]) + 1 <= width:
-                # Add the word to the wrapped string
-                wrapped = wrapped + list_for_processing[word] + ' '
-                # Increment the counter
-                counter = counter + len(list_for_processing[word]) + 1
-            else:
-                # Add a newline, and the word in question. Increment counter
-                wrapped = wrapped + '\n' + '                    ' + list_for_processing[word] + ' '
-                counter = len(list_for_processing[word])
-        # Add the string to the list for later processing
-        mid_processing_list.append(wrapped)
-
-    # Perform character substitution, replacing special marker characters with terminal commands
-    final_list = []
-    final_string = ''
-    for x in mid_processing_list:
-        for z in x:
-            if z == '@':
-                # Bold Red Text for Items
-                new_char = '\033[1;31m'
-            elif z == '^':
-                # Bold Purple Text for Features
-                new_char = '\033[1;35m'
-            elif z == '$':
-                # Bold Cyan Text for Directions
-                new_char = '\033[1;36m'
-            elif z == '~':
-                # Bold Yellow Text for End Game Hints
-                new_char = '\033[1;33m'
-            elif z == '#':
-                # End terminal command, reset to normal
-                new_char = '\033[0m'
-            else:
-                new_char = z
-            final_string = final_string + new_char
-        final_list.append(final_string)
-        final_string = ''
-
-    return final_list
\ No newline at end of file
+    return ''.join(pieces)
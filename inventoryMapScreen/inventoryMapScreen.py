@@ -1,366 +1,296 @@
+import json
 import os
+import sys
+from Layout import layout
+from OutputSink import get_color_mode
+from Terminal import terminal
+from inventoryMapScreen import roomMap
 
-def display(inventory, heroLocationName, heroLocationId, rooms):
+# The map frames are kept as text files in this directory, one per floor or area and state, and are only read the first
+# time they are shown
+MAP_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'maps')
+
+# Where each room's name is written on each frame, as lists of [row, column, text]
+LABEL_FILE = os.path.join(MAP_DIRECTORY, 'labels.json')
+
+# Colors the hero's room is highlighted with
+HIGHLIGHT = '\033[1;33m'
+RESET = '\033[0m'
+
+# The parts of the world the maps change with. Each flag is set when a Room has an exit ('exit', room id, direction) or
+# when one of its Features has been used ('feature', room id, feature name)
+WORLD_FLAGS = {
+    'attic': ('exit', 13, 'southeast'),
+    'tunnel': ('exit', 18, 'down'),
+    'grave': ('feature', 21, 'grave'),
+}
+
+# Each mapChoice to the flag that selects between its frames, the frame shown while the flag is off and the one shown
+# once it is on
+MAP_VARIANTS = {
+    1: (None, 'first_floor', 'first_floor'),
+    2: (None, 'second_floor', 'second_floor'),
+    3: ('attic', 'attic_base_state', 'attic_revealed'),
+    4: ('tunnel', 'cellar_base_state', 'cellar_revealed'),
+    5: ('grave', 'front_lawn_base_state', 'front_lawn_with_grave'),
+    6: ('tunnel', 'gardens_base_state', 'gardens_revealed'),
+}
+
+# Frame name to its text, filled in as frames are loaded. Frames are read-only, so every Game shares them
+frames = {}
+
+# Frame name to the labels of the rooms on it, loaded with the first frame
+labels = {}
+
+# Margin of the generated maps, lined up with the hand-drawn frames
+MAP_INDENT = ' ' * 7
+
+class MapState:
+    """Class used to hold the map state of one Game, so a new or loaded game, or another session, starts its own
+
+    Attributes
+    ----------
+    world_flags: dict
+        flag name to whether it is set, kept up to date by update_flags()
+    explored: set
+        room_ids the hero has been in this game. Generated maps only show these rooms
+    hand_drawn: dict
+        the world version and whether every room in it is on a hand-drawn frame
+    highlights: dict
+        (frame name, room name, in color, inline) to the text that highlights the room on the frame
+    room_maps: dict
+        world version to its RoomMap, whose canvases hold the explored rooms drawn so far
+    """
+
+    def __init__(self):
+        """Constructor for the MapState class
+        """
+        self.world_flags = {}
+        self.explored = set()
+        self.hand_drawn = {}
+        self.highlights = {}
+        self.room_maps = {}
+
+def display(inventory, heroLocationName, heroLocationId, rooms, state):
     """Displays the current inventory to screen and calls helper function printMap to display map
-    :param: Inventory inventory, string heroLocationName, intenger heroLocationId, list rooms
+    :param: Inventory inventory, string heroLocationName, intenger heroLocationId, list rooms, MapState state
     :return:
     """
-    selection = -1
+    terminal.clear()
+    print()
+    print(' ', end='      ')
+    inventory.show_inventory_map_screen()
+    print()
+    print('       You are currently in the {}'.format(heroLocationName))
 
-    while selection != ' ':
-        os.system('clear')
-        print()
-        print(' ', end='      ')
-        inventory.show_inventory_map_screen()
-        print()
-        print('       You are currently in the {}'.format(heroLocationName))
-
-        if heroLocationId < 8 or heroLocationId == 20:
-            printMap(1, rooms)
-        elif heroLocationId >= 8 and heroLocationId < 13 or heroLocationId == 22:
-            printMap(2, rooms)
-        elif heroLocationId == 13:
-            printMap(3, rooms)
-        elif heroLocationId > 13 and heroLocationId < 18:
-            printMap(4, rooms)
-        elif heroLocationId > 17 and heroLocationId < 20:
-            printMap(6, rooms)
-        else:
-            printMap(5, rooms)
+    # The hand-drawn maps are used for the mansion they were drawn for. Any other world gets a map generated from its
+    # exits
+    mapChoice = findMap(heroLocationName, rooms, state)
+    if mapChoice is not None:
+        printMap(mapChoice, rooms, state, heroLocationName)
+    else:
+        printGeneratedMap(heroLocationId, rooms, state)
 
-        print('\n\n')
+    print('\n\n')
 
-        selection = input('       press \'enter\' to return to the game... ')
-        selection = ' ' + selection
+    # The map stays on screen until enter is pressed on its own. Anything else typed is erased and the prompt shown
+    # again, rather than the whole screen being drawn again
+    selection = ' ' + input('       press \'enter\' to return to the game... ')
+    while selection != ' ':
+        terminal.write('cursor_up', 1)
+        terminal.write('erase_line')
+        selection = ' ' + input('       press \'enter\' to return to the game... ')
 
     # Having reached this point, selection matches. Clear screen to get ready to return to the game
-    os.system('clear')
+    terminal.clear()
 
-def printMap(mapChoice, rooms):
-    """Displays the map to the screen
-    :param: integer mapChoice, list rooms
+def printMap(mapChoice, rooms, state, heroLocationName=None):
+    """Displays the map to the screen, with the room the hero is in highlighted
+    :param: integer mapChoice, list rooms, MapState state, string heroLocationName
     :return:
     """
-    first_floor = """
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
-       ▒                                                                                                             ▒
-       ▒                                                  First Floor                                                ▒
-       ▒                                                                                                             ▒
-       ▒            ---------------                                   ^                                              ▒
-       ▒          /                 \\                                / \\                                             ▒
-       ▒         /                   \\                                |                                              ▒
-       ▒        /      Solarium       \\                               |                                              ▒
-       ▒       /                       \\                    To Gardens and Gazebo                                    ▒
-       ▒      /__________|  |___________\\___________________________|  |______________________________________       ▒
-       ▒     |                               |                                    |                           |      ▒
-       ▒     |                               |                                    --                          |      ▒
-       ▒     |          Game Room            |      __|        Kitchen                                        |      ▒
-       ▒     |                               |   __|                              --                          |      ▒
-       ▒     |                               |  |  Stairs (to cellar)             |                           |      ▒
-       ▒     |                 ____________________________________________________            Dining         |      ▒
-       ▒     |                --                    |                             |             Room          |      ▒
-       ▒     |                        Bathroom      |                 __          |                           |      ▒
-       ▒     |                --                    |              __|            |                           |      ▒
-       ▒     |__________|   |__|______________|   |_|           __|               |                           |      ▒
-       ▒     |                               |               __| Grand            |                           |      ▒
-       ▒     |                               |              |   Staircase         |                           |      ▒
-       ▒     |                               |                                    |____________|    |_________|      ▒
-       ▒     |                               --                                   |                           |      ▒
-       ▒     |           Library                                                  |                           |      ▒
-       ▒     |                               --                                   --                          |      ▒
-       ▒     |                               |                                                 Parlor         |      ▒
-       ▒     |                               |              Foyer                 --                          |      ▒
-       ▒     |                               |                                    |                           |      ▒
-       ▒     |_______________________________|_____________|      |_______________|___________________________|      ▒
-       ▒                    |                                                               |                        ▒
-       ▒                    |                               Porch                           |                        ▒
-       ▒                    |                                                               |                        ▒
-       ▒                    |____________________________|          |_______________________|                        ▒
-       ▒                                                To Front Lawns                                               ▒
-       ▒                                                      |                                                      ▒
-       ▒                                                      |                                                      ▒
-       ▒                                                     \\ /                                                     ▒
-       ▒                                                      v                                                      ▒
-       ▒                                                                                                             ▒
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒"""
-
-    attic_base_state = """
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
-       ▒                                                                                                             ▒
-       ▒                        Attic                                                                                ▒
-       ▒                                                                                                             ▒
-       ▒                     ___________________________________________________________________                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |             __|                                                 |                     ▒
-       ▒                     |          __|                                                    |                     ▒
-       ▒                     |       __|  Stairs                                               |                     ▒
-       ▒                     |      |    (to 2nd Floor)                                        |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |_________________________________________________________________|                     ▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒"""
-
-    attic_revealed = """
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
-       ▒                                                                                                             ▒
-       ▒                        Attic                                                                                ▒
-       ▒                                                                                                             ▒
-       ▒                     ___________________________________________________________________                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |             __|                                                 |                     ▒
-       ▒                     |          __|                                                    |                     ▒
-       ▒                     |       __|  Stairs                                               |                     ▒
-       ▒                     |      |    (to 2nd Floor)                                        |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                                 |                     ▒
-       ▒                     |                                                 ----------------|                     ▒
-       ▒                     |                                                |                |                     ▒
-       ▒                     |                                                |                |                     ▒
-       ▒                     |                                                |      Hidden    |                     ▒
-       ▒                     |                                                |       Room     |                     ▒
-       ▒                     |                                                |                |                     ▒
-       ▒                     |________________________________________________|________________|                     ▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒"""
-
-    gardens_base_state = """
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                                          Gardens and Gazebo                                                 ▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                     __________________________                       ---------------                        ▒
-       ▒                    |                          |                    /                 \                      ▒
-       ▒                    |                          |                   /                   \                     ▒
-       ▒                    |                          |                  /                     \                    ▒
-       ▒                    |          Rose            |                 |                       |                   ▒
-       ▒                    |         Gardens          |                 |        Gazebo         |                   ▒
-       ▒                    |                          |                 |                       |                   ▒
-       ▒                    |                          |                  \                     /                    ▒
-       ▒                    |                          |                   \                   /                     ▒
-       ▒                    |                          |                    \                 /                      ▒
-       ▒                    |__________________________|                      ---------------                        ▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                                             -----------                                                     ▒
-       ▒                                            |           |                                                    ▒
-       ▒                                            | Fountain  |                                                    ▒
-       ▒                           To Rear          |           |                                                    ▒
-       ▒                           of House         |           |                                                    ▒
-       ▒                              |              -----------                                                     ▒
-       ▒                              |                                                                              ▒
-       ▒                              |                                                                              ▒
-       ▒                            \\  /                                                                             ▒
-       ▒                              v                                                                              ▒
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒"""
-
-    gardens_revealed = """
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                                          Gardens and Gazebo                                                 ▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                     __________________________                       ---------------                        ▒
-       ▒                    |                          |                    /                 \                      ▒
-       ▒                    |                          |                   /                   \                     ▒
-       ▒                    |                          |                  /                     \                    ▒
-       ▒                    |          Rose            |                 |                       |                   ▒
-       ▒                    |         Gardens          |                 |        Gazebo         |                   ▒
-       ▒                    |                          |                 |                       |                   ▒
-       ▒                    |                          |                  \                     /                    ▒
-       ▒                    |                          |                   \                   /                     ▒
-       ▒                    |                          |                    \                 /                      ▒
-       ▒                    |__________________________|                      ---------------                        ▒
-       ▒                                                                        |         |                          ▒
-       ▒                                                                        |         |                          ▒
-       ▒                                             -----------                |  Dark   |                          ▒
-       ▒                                            |           |               | Tunnel  |                          ▒
-       ▒                                            | Fountain  |               |         |                          ▒
-       ▒                           To Rear          |           |               |         |                          ▒
-       ▒                           of House         |           |               |         |                          ▒
-       ▒                              |              -----------                |         |                          ▒
-       ▒                              |                                         |         |                          ▒
-       ▒                              |                                         |         |                          ▒
-       ▒                             \\ /                                        |         |                          ▒
-       ▒                              v                                         |         |                          ▒
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒"""
-
-    cellar_base_state = """
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                                           Cellar                                                            ▒
-       ▒     ______________________________________________________________________________________                  ▒
-       ▒    |                                                                                      |                 ▒
-       ▒    |-------                                               -----------------------------   |                 ▒
-       ▒    |       |                       __                    |                             |  |                 ▒
-       ▒    | Work  |                    __|                      |                             |  |                 ▒
-       ▒    | Bench |                 __| Stairs                  |          Shelves            |  |                 ▒
-       ▒    |       |                | (To 1st Floor)             |                             |  |                 ▒
-       ▒    |       |                                             |                             |  |                 ▒
-       ▒    |-------                                               -----------------------------   |                 ▒
-       ▒    |__________________        ____________________________________________________________|                 ▒
-       ▒    |                  |      |    |                      |                                |                 ▒
-       ▒    |                              |                      |                                |                 ▒
-       ▒    |                              --                     |                                |                 ▒
-       ▒    |       Servant's                      Servant's      |                                |                 ▒
-       ▒    |       Quarters               --      Bathroom       |                                |                 ▒
-       ▒    |                              |                      |                                |                 ▒
-       ▒    |______________________________|______________________|________________________________|                 ▒
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒"""
-
-    cellar_revealed = """
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
-       ▒                                                                                                             ▒
-       ▒                                                                                               |        |    ▒
-       ▒                                           Cellar                                              |  Dark  |    ▒
-       ▒     ______________________________________________________________________________________    | Tunnel |    ▒
-       ▒    |                                                                                      |   |        |    ▒
-       ▒    |-------                                               -----------------------------   |   |        |    ▒
-       ▒    |       |                       __                    |                             |  |   |        |    ▒
-       ▒    | Work  |                    __|                      |                             |  |   |        |    ▒
-       ▒    | Bench |                 __| Stairs                  |          Shelves            |  |   |        |    ▒
-       ▒    |       |                | (To 1st Floor)             |                             |  |   |        |    ▒
-       ▒    |       |                                             |                             |  |   |        |    ▒
-       ▒    |-------                                               -----------------------------   |  /         |    ▒
-       ▒    |__________________        ____________________________________________________________|/           /    ▒
-       ▒    |                  |      |    |                      |                                .          /      ▒
-       ▒    |                              |                      |                                .        /        ▒
-       ▒    |                              --                     |                                .      /          ▒
-       ▒    |       Servant's                      Servant's      |             Crypt              ._ _ /            ▒
-       ▒    |       Quarters               --      Bathroom       |                                |                 ▒
-       ▒    |                              |                      |                                |                 ▒
-       ▒    |______________________________|______________________|________________________________|                 ▒
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒"""
-
-    front_lawn_base_state = """
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                                                Front Lawns                  ^                               ▒
-       ▒                                                                            / \\                              ▒
-       ▒                                                                             | To Front                      ▒
-       ▒                                                                             | Of House                      ▒
-       ▒                                                                             |                               ▒
-       ▒                                _______________                                                              ▒
-       ▒                               |               |                                                             ▒
-       ▒                               |    Purple     |                          ----                               ▒
-       ▒                               |    Flower     |                         |    |  large                       ▒
-       ▒                               |    Garden     |                         |    |  tree                        ▒
-       ▒                               |               |                          ----                               ▒
-       ▒                               |_______________|                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                            ---                                           ---                                ▒
-       ▒                           |   |  tree                                   |   |  tree                         ▒
-       ▒                            ---               |            |              ---                                ▒
-       ▒                                              |            |                                                 ▒
-       ▒                            ---               |            |              ---                                ▒
-       ▒                           |   |  tree        |            |             |   |  tree                         ▒
-       ▒                            ---               |            |              ---                                ▒
-       ▒                                              |            |                                                 ▒
-       ▒                                              |            |                                                 ▒
-       ▒                                            Front Gate(Locked)                                               ▒
-       ▒                           __________________..................______________________                        ▒
-       ▒                                                                                                             ▒
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒"""
-
-    front_lawn_with_grave = """
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                                                Front Lawns                  ^                               ▒
-       ▒                                                                            / \\                              ▒
-       ▒                                                                             | To Front                      ▒
-       ▒                                                                             | Of House                      ▒
-       ▒                                                                             |                               ▒
-       ▒                                _______________                                                              ▒
-       ▒                               |               |                                                             ▒
-       ▒                               |    Purple     |                          ----                               ▒
-       ▒                               |    Flower     |              xxxxxx     |    |  large                       ▒
-       ▒                               |    Garden     |       grave  x    x     |    |  tree                        ▒
-       ▒                               |               |              xxxxxx      ----                               ▒
-       ▒                               |_______________|                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                            ---                                           ---                                ▒
-       ▒                           |   |  tree                                   |   |  tree                         ▒
-       ▒                            ---               |            |              ---                                ▒
-       ▒                                              |            |                                                 ▒
-       ▒                            ---               |            |              ---                                ▒
-       ▒                           |   |  tree        |            |             |   |  tree                         ▒
-       ▒                            ---               |            |              ---                                ▒
-       ▒                                              |            |                                                 ▒
-       ▒                                              |            |                                                 ▒
-       ▒                                            Front Gate(Locked)                                               ▒
-       ▒                           __________________..................______________________                        ▒
-       ▒                                                                                                             ▒
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒"""
-
-    second_floor = """
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒                                                Second Floor                                                 ▒
-       ▒              _________________________________________________________________________________              ▒
-       ▒             |                |                              |                                 |             ▒
-       ▒             |                |            Pink Room         |                                 |             ▒
-       ▒             |               --                              --                                |             ▒
-       ▒             |    Red Room            __|                                 Green Room           |             ▒
-       ▒             |               --    __|                       --                                |             ▒
-       ▒             |                |   |   Stairs (to attic)      |                                 |             ▒
-       ▒             |                |______________________________|_______                          |             ▒
-       ▒             |                |    2nd Floor Landing                 |                         |             ▒
-       ▒             |               --                   ___                --                        |             ▒
-       ▒             |                                ___|                                             |             ▒
-       ▒             |               --           ___|Grand Staircase        --                        |             ▒
-       ▒             |                |          | (To 1st Floor/Attic)      |                         |             ▒
-       ▒             |________________|                                      --------------------------|             ▒
-       ▒             |                |              _____________           |                         |             ▒
-       ▒             |  Linen        --             |             |          --      Bathroom          |             ▒
-       ▒             |  Closet       --             |    Piano    |          --                        |             ▒
-       ▒             |________________|_____________|_____________|__________|_________________________|             ▒
-       ▒                                                                                                             ▒
-       ▒                                                                                                             ▒
-       ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒"""
-
-    # Determine which map should be displayed to the user based on location and on room descriptions to determine player's progress in the game
-    if mapChoice == 1:
-        print(first_floor)
-    if mapChoice == 2:
-        print(second_floor)
-    if mapChoice == 3:
-        if rooms[13].long_des == 'You are standing in the Attic. Everything remains as it was with one exception: the boards around the walled in area have fallen exposing the entrance to a hidden room to the southeast.':
-            print(attic_revealed)
-        else:
-            print(attic_base_state)
-    if mapChoice == 4:
-        if rooms[18].long_des == 'You have uncovered a tunnel under the gazebo....':
-            print(cellar_revealed)
-        else:
-            print(cellar_base_state)
-    if mapChoice == 5:
-        if rooms[21].long_des == 'You are on the front lawns of the mansion. A grave is dug at the base of a tree. There is a flower garden nearby bordered in strange stone. You see the mansion to the North.' or rooms[21].long_des == 'You are on the front lawns of the mansion. The freshly filled grave is here. There are some gardens nearby bordered in strange stone. You see the mansion to the North.' or rooms[21].long_des == 'You are on the front lawns of the mansion. The grave grave is here, with the crying girl above, holding out her hand. There are some gardens nearby bordered in strange stone. You see the mansion to the North.':
-            print(front_lawn_with_grave)
-        else:
-            print(front_lawn_base_state)
-    if mapChoice == 6:
-        if rooms[18].long_des == 'You have uncovered a tunnel under the gazebo....':
-            print(gardens_revealed)
+    name = chooseMap(mapChoice, rooms, state)
+    frame = get_frame(name)
+
+    # The frame is printed as it is stored and the room's name is then written over it in color. If the cursor can't
+    # be moved back up over the frame the name is highlighted in a copy of the frame instead
+    if can_patch(frame):
+        print(frame)
+        sys.stdout.write(get_highlight(name, heroLocationName, False, state))
+    else:
+        print(get_highlight(name, heroLocationName, True, state))
+
+def printGeneratedMap(heroLocationId, rooms, state):
+    """Displays the floor the hero is on, laid out from the rooms' exits, showing only the rooms explored so far
+    :param: integer heroLocationId, list rooms, MapState state
+    :return:
+    """
+    room_map = roomMap.get_room_map(rooms, state.room_maps)
+    floor = room_map.positions[heroLocationId][2]
+    canvas = room_map.get_canvas(floor)
+    canvas.update(state.explored | {heroLocationId})
+    lines = canvas.get_text().split('\n')
+
+    # Rows of rooms not explored yet are left off the top and bottom
+    drawn = [row for row, line in enumerate(lines) if line.strip()]
+    top = drawn[0] if drawn else 0
+    lines = lines[top:drawn[-1] + 1] if drawn else lines
+
+    # A floor wider than the screen is cut down to the part around the hero
+    width = max(roomMap.BOX_WIDTH, layout.columns - len(MAP_INDENT) - 1)
+    left = 0
+    if len(lines[0]) > width:
+        x, y = canvas.corner(heroLocationId)
+        left = max(0, min(len(lines[0]) - width, x + roomMap.BOX_WIDTH // 2 - width // 2))
+
+    frame = '\n'.join(['', MAP_INDENT + room_map.floor_name(floor), '']
+                      + [MAP_INDENT + line[left:left + width].rstrip() for line in lines]
+                      + ['', MAP_INDENT + 'U - stairs up    D - stairs down'])
+    cells = [[row - top + 3, column + len(MAP_INDENT) - left, text]
+             for row, column, text in canvas.get_label(heroLocationId)
+             if left <= column and column + len(text) <= left + width]
+
+    if can_patch(frame):
+        print(frame)
+        sys.stdout.write(build_highlight(frame, cells, False))
+    else:
+        print(build_highlight(frame, cells, True))
+
+def can_patch(frame):
+    """Checks if the hero's room can be highlighted by moving the cursor back up over a frame once it is printed
+    :param: string frame
+    :return: boolean
+    """
+    return can_color() and frame.count('\n') < layout.rows
+
+def can_color():
+    """Checks if the hero's room can be highlighted in color. Output that isn't going to a terminal gets no escape codes
+    :param:
+    :return: boolean
+    """
+    return not terminal.headless and get_color_mode() == 'ansi'
+
+def findMap(heroLocationName, rooms, state):
+    """Finds the hand-drawn map showing the hero's room
+    :param: string heroLocationName, list rooms, MapState state
+    :return: integer mapChoice, or None if the world isn't the one the maps were drawn for
+    """
+    version = roomMap.get_world_version(rooms)
+    if state.hand_drawn.get('version') != version:
+        named = {room for frame_labels in load_labels().values() for room in frame_labels}
+        state.hand_drawn['version'] = version
+        state.hand_drawn['complete'] = all(room.name in named for room in rooms)
+
+    if not state.hand_drawn['complete']:
+        return None
+
+    for mapChoice in MAP_VARIANTS:
+        if get_labels(chooseMap(mapChoice, rooms, state), heroLocationName):
+            return mapChoice
+    return None
+
+def explore(room_id, state):
+    """Records that the hero has been in a room, so generated maps show it
+    :param: integer room_id, MapState state
+    :return:
+    """
+    state.explored.add(room_id)
+
+def reset_exploration(rooms, heroLocationId, state):
+    """Starts the record of explored rooms for a new or loaded game, from the rooms marked visited
+    :param: list rooms, integer heroLocationId, MapState state
+    :return:
+    """
+    state.explored.clear()
+    state.explored.update(room.room_id for room in rooms if room.visited)
+    state.explored.add(heroLocationId)
+
+def chooseMap(mapChoice, rooms, state):
+    """Chooses the frame for a map, using the world flags to determine player's progress in the game
+    :param: integer mapChoice, list rooms, MapState state
+    :return: string name of the frame
+    """
+    if not state.world_flags:
+        update_flags(rooms, state)
+
+    flag, base_state, revealed = MAP_VARIANTS[mapChoice]
+    if flag is not None and state.world_flags[flag]:
+        return revealed
+    return base_state
+
+def update_flags(rooms, state):
+    """Works out each of the world flags from the rooms. Called when the Game is loaded and after a task is performed
+    :param: list rooms, MapState state
+    :return:
+    """
+    for flag, (kind, room_id, name) in WORLD_FLAGS.items():
+        room = rooms[room_id]
+        if kind == 'exit':
+            state.world_flags[flag] = name in room.directions
         else:
-            print(gardens_base_state)
+            status, feature = room.get_feature(name)
+            state.world_flags[flag] = status and feature.state != 0
+
+def get_frame(name):
+    """Returns a map frame, reading it from its file the first time it is needed
+    :param: string name
+    :return: string frame
+    """
+    frame = frames.get(name)
+    if frame is None:
+        with open(os.path.join(MAP_DIRECTORY, name + '.txt'), 'r', encoding='utf-8') as frame_file:
+            frame = frame_file.read().rstrip('\n')
+        frames[name] = frame
+    return frame
+
+def get_labels(name, heroLocationName):
+    """Returns where a room's name is written on a frame
+    :param: string name, string heroLocationName
+    :return: list of [row, column, text]. Empty if the room isn't named on the frame
+    """
+    return load_labels().get(name, {}).get(heroLocationName, [])
+
+def load_labels():
+    """Reads the room labels of every frame the first time they are needed
+    :param:
+    :return: dict of frame name to room name to list of [row, column, text]
+    """
+    if not labels:
+        with open(LABEL_FILE, 'r', encoding='utf-8') as label_file:
+            labels.update(json.load(label_file))
+    return labels
+
+def get_highlight(name, heroLocationName, inline, state):
+    """Builds the text that highlights a room on a frame, once per frame, room, color mode and kind
+
+    A patch holds only the room's name in color, written at its place on the frame with cursor movements relative to
+    the line under the frame, which is where the cursor is after the frame is printed. An inline highlight is a copy of
+    the whole frame with the name in color, or in capitals when there is no terminal or the color mode isn't 'ansi'.
+
+    :param: string name, string heroLocationName, boolean inline, MapState state
+    :return: string
+    """
+    key = (name, heroLocationName, can_color(), inline)
+    highlight = state.highlights.get(key)
+    if highlight is None:
+        highlight = state.highlights[key] = build_highlight(get_frame(name), get_labels(name, heroLocationName), inline)
+    return highlight
+
+def build_highlight(frame, cells, inline):
+    """Builds the patch or the inline highlight for a frame. See get_highlight()
+    :param: string frame, list cells of [row, column, text], boolean inline
+    :return: string
+    """
+    if not inline:
+        height = frame.count('\n') + 1
+        # Every move starts from the saved position under the frame
+        restore = terminal.sequence('restore_cursor')
+        patches = [restore + terminal.sequence('cursor_up', height - row) + terminal.sequence('column', column)
+                   + HIGHLIGHT + text + RESET for row, column, text in cells]
+        return terminal.sequence('save_cursor') + ''.join(patches) + restore if patches else ''
+
+    lines = frame.split('\n')
+    for row, column, text in cells:
+        marked = HIGHLIGHT + text + RESET if can_color() else text.upper()
+        lines[row] = lines[row][:column] + marked + lines[row][column + len(text):]
+    return '\n'.join(lines)
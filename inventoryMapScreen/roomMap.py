@@ -0,0 +1,340 @@
+import textwrap
+from collections import deque
+
+# Where each exit leads relative to its Room, as (columns east, rows south, floors up). Exits that aren't a compass
+# direction ("door") are placed next to their Room on the same floor, wherever there is space
+EXIT_OFFSETS = {
+    'north': (0, -1, 0),
+    'south': (0, 1, 0),
+    'east': (1, 0, 0),
+    'west': (-1, 0, 0),
+    'northeast': (1, -1, 0),
+    'northwest': (-1, -1, 0),
+    'southeast': (1, 1, 0),
+    'southwest': (-1, 1, 0),
+    'up': (0, 0, 1),
+    'down': (0, 0, -1),
+    'down hole': (0, 0, -1),
+}
+
+# Size of a Room's box on the map and of the gaps between boxes, in characters
+BOX_WIDTH = 14
+BOX_HEIGHT = 4
+GAP_WIDTH = 4
+GAP_HEIGHT = 2
+
+# How far from its place a Room is moved, at most, when another Room already holds it
+SEARCH_DISTANCE = 6
+
+def get_world_version(rooms):
+    """
+    This function returns a stamp that changes whenever a Room is added or an exit is added to any Room.
+
+    Parameters
+    ----------
+    rooms - The Game's rooms_list
+
+    Returns
+    -------
+    : Tuple of the number of Rooms and the newest directions_version
+    """
+    return len(rooms), max((room.directions_version for room in rooms), default=None)
+
+
+def get_room_map(rooms, room_maps):
+    """
+    This function returns the RoomMap for the Rooms, laying it out only if the world has changed since the last call.
+
+    Parameters
+    ----------
+    rooms - The Game's rooms_list
+    room_maps - The Game's RoomMap for the most recent world version, keyed by the version. A new one is only laid out
+    when the Rooms or their exits change
+
+    Returns
+    -------
+    : RoomMap
+    """
+    version = get_world_version(rooms)
+    room_map = room_maps.get(version)
+    if room_map is None:
+        room_maps.clear()
+        room_map = room_maps[version] = RoomMap(rooms)
+    return room_map
+
+
+class RoomMap:
+    """ Class that lays the Rooms out on a grid of floors, following their exits
+
+    The first Room is placed on the ground floor and every Room reached from it is placed one cell away
+    in the direction of the exit, or one floor up or down for stairs. A Room whose cell is already taken is moved on
+    further in the same direction, or else to the nearest free cell. Rooms only reached by exits into them are placed
+    the same way from the other side.
+
+    Attributes
+    ----------
+        rooms - The Game's rooms_list
+        positions - Dictionary of room_id to (column, row, floor)
+        neighbours - Dictionary of room_id to a list of (offset, room_id) for every exit out of or into the Room
+        floors - Dictionary of floor to the room_ids on it
+        canvases - Dictionary of floor to its FloorCanvas, made when the floor is first shown
+
+    Methods
+    -------
+    place():
+        finds a free cell for a Room near the one it should be in
+    get_canvas():
+        returns the FloorCanvas for a floor
+    floor_name():
+        returns the heading shown above a floor
+    """
+
+    def __init__(self, rooms):
+        self.rooms = rooms
+        self.positions = {}
+        self.neighbours = {room.room_id: [] for room in rooms}
+        self.floors = {}
+        self.canvases = {}
+        occupied = {}
+
+        for room in rooms:
+            for direction, room_id in room.directions.items():
+                if room_id not in self.neighbours or room_id == room.room_id:
+                    continue
+                offset = EXIT_OFFSETS.get(direction)
+                reverse = tuple(-step for step in offset) if offset is not None else None
+                self.neighbours[room.room_id].append((offset, room_id))
+                self.neighbours[room_id].append((reverse, room.room_id))
+
+        for room in rooms:
+            if room.room_id in self.positions:
+                continue
+
+            # Rooms that can't be reached from any placed Room start a new group to the east of everything else
+            column = max((position[0] for position in self.positions.values()), default=-2) + 2
+            self.place(room.room_id, (column, 0, 0), None, occupied)
+
+            queue = deque([room.room_id])
+            while queue:
+                room_id = queue.popleft()
+                column, row, floor = self.positions[room_id]
+                for offset, neighbour in self.neighbours[room_id]:
+                    if neighbour in self.positions:
+                        continue
+                    step = offset or (0, 0, 0)
+                    cell = (column + step[0], row + step[1], floor + step[2])
+                    self.place(neighbour, cell, offset, occupied)
+                    queue.append(neighbour)
+
+        for room_id, (column, row, floor) in self.positions.items():
+            self.floors.setdefault(floor, []).append(room_id)
+
+    def place(self, room_id, cell, offset, occupied):
+        """
+        This function puts a Room in the given cell or, if that is taken, in the nearest free one.
+
+        Parameters
+        ----------
+        room_id - The Room being placed
+        cell - (column, row, floor) the Room should be in
+        offset - The exit offset that led here, or None. A flat offset is followed further before looking elsewhere
+        occupied - Dictionary of every taken cell to its room_id
+        """
+        column, row, floor = cell
+        candidates = [cell]
+
+        if offset is not None and offset[:2] != (0, 0):
+            candidates += [(column + offset[0] * distance, row + offset[1] * distance, floor)
+                           for distance in range(1, SEARCH_DISTANCE)]
+
+        # Then every cell on the floor within SEARCH_DISTANCE, nearest first
+        ring = [(column + x, row + y, floor)
+                for x in range(-SEARCH_DISTANCE, SEARCH_DISTANCE + 1)
+                for y in range(-SEARCH_DISTANCE, SEARCH_DISTANCE + 1)]
+        candidates += sorted(ring, key=lambda other: (max(abs(other[0] - column), abs(other[1] - row)),
+                                                      abs(other[0] - column) + abs(other[1] - row)))
+
+        free = next((candidate for candidate in candidates if candidate not in occupied), None)
+        if free is None:
+            # Every nearby cell is taken, so start a new column to the east of the floor
+            free = (max(position[0] for position in occupied if position[2] == floor) + 1, row, floor)
+
+        self.positions[room_id] = free
+        occupied[free] = room_id
+
+    def get_canvas(self, floor):
+        """
+        This function returns the FloorCanvas for a floor, making it the first time the floor is shown.
+        """
+        canvas = self.canvases.get(floor)
+        if canvas is None:
+            canvas = self.canvases[floor] = FloorCanvas(self, floor)
+        return canvas
+
+    @staticmethod
+    def floor_name(floor):
+        """
+        This function returns the heading shown above a floor.
+        """
+        if floor == 0:
+            return 'Ground Floor'
+        elif floor > 0:
+            return 'Upper Floor {}'.format(floor)
+        return 'Lower Floor {}'.format(-floor)
+
+
+class FloorCanvas:
+    """ Class holding the drawing of one floor of a RoomMap
+
+    Only the Rooms the hero has explored are drawn, along with the exits leading out of them. When more Rooms are
+    explored only their boxes and exits are drawn onto the canvas; the rest of the drawing is kept as it was.
+
+    Attributes
+    ----------
+        room_map - The RoomMap the floor belongs to
+        floor - The floor drawn
+        origin - (column, row) of the floor's top left cell
+        cells - List of rows, each a list of characters
+        drawn - Set of the room_ids drawn so far
+        text - The canvas joined into lines, None when it has changed since it was last joined
+
+    Methods
+    -------
+    update():
+        draws any newly explored Rooms
+    get_text():
+        returns the canvas as a string
+    get_label():
+        returns where a Room's name is written on the canvas
+    """
+
+    def __init__(self, room_map, floor):
+        self.room_map = room_map
+        self.floor = floor
+        positions = [room_map.positions[room_id] for room_id in room_map.floors[floor]]
+        self.origin = (min(position[0] for position in positions), min(position[1] for position in positions))
+
+        columns = max(position[0] for position in positions) - self.origin[0] + 1
+        rows = max(position[1] for position in positions) - self.origin[1] + 1
+        width = columns * (BOX_WIDTH + GAP_WIDTH) - GAP_WIDTH
+        height = rows * (BOX_HEIGHT + GAP_HEIGHT) - GAP_HEIGHT
+
+        self.cells = [[' '] * width for row in range(height)]
+        self.drawn = set()
+        self.text = None
+
+    def corner(self, room_id):
+        """
+        This function returns the (x, y) character position of the top left corner of a Room's box.
+        """
+        column, row, floor = self.room_map.positions[room_id]
+        return ((column - self.origin[0]) * (BOX_WIDTH + GAP_WIDTH),
+                (row - self.origin[1]) * (BOX_HEIGHT + GAP_HEIGHT))
+
+    def update(self, explored):
+        """
+        This function draws the explored Rooms on the floor that haven't been drawn yet.
+
+        Parameters
+        ----------
+        explored - Set of the room_ids the hero has been in
+
+        Returns
+        -------
+        : bool True if anything was drawn
+        """
+        new_rooms = [room_id for room_id in self.room_map.floors[self.floor]
+                     if room_id in explored and room_id not in self.drawn]
+
+        for room_id in new_rooms:
+            self.draw_room(room_id)
+            for offset, neighbour in self.room_map.neighbours[room_id]:
+                self.draw_exit(room_id, neighbour)
+            self.drawn.add(room_id)
+
+        if new_rooms:
+            self.text = None
+        return bool(new_rooms)
+
+    def write(self, x, y, text):
+        for position, character in enumerate(text):
+            self.cells[y][x + position] = character
+
+    def draw_room(self, room_id):
+        """
+        This function draws a Room's box with its name inside, and marks stairs up and down on its bottom edge.
+        """
+        x, y = self.corner(room_id)
+        border = '+' + '-' * (BOX_WIDTH - 2) + '+'
+        self.write(x, y, border)
+
+        for line, text in enumerate(self.get_name_lines(room_id)):
+            left = (BOX_WIDTH - 2 - len(text)) // 2
+            self.write(x, y + 1 + line, '|' + (' ' * left + text).ljust(BOX_WIDTH - 2) + '|')
+
+        bottom = list(border)
+        for offset, neighbour in self.room_map.neighbours[room_id]:
+            if offset is not None and offset[2] > 0:
+                bottom[2] = 'U'
+            elif offset is not None and offset[2] < 0:
+                bottom[-3] = 'D'
+        self.write(x, y + BOX_HEIGHT - 1, ''.join(bottom))
+
+    def draw_exit(self, room_id, neighbour):
+        """
+        This function draws the line between a Room and a neighbouring Room on the same floor, if they are side by side.
+        Exits to other floors are shown by draw_room(), and exits to Rooms further away aren't drawn.
+        """
+        column, row, floor = self.room_map.positions[room_id]
+        other_column, other_row, other_floor = self.room_map.positions[neighbour]
+        dx, dy = other_column - column, other_row - row
+        if other_floor != floor or max(abs(dx), abs(dy)) != 1:
+            return
+
+        x, y = self.corner(room_id)
+        if dy == 0:
+            gap_x = x + BOX_WIDTH if dx > 0 else x - GAP_WIDTH
+            self.write(gap_x, y + 1, '-' * GAP_WIDTH)
+        elif dx == 0:
+            gap_y = y + BOX_HEIGHT if dy > 0 else y - GAP_HEIGHT
+            for line in range(GAP_HEIGHT):
+                self.write(x + BOX_WIDTH // 2, gap_y + line, '|')
+        else:
+            gap_x = x + BOX_WIDTH if dx > 0 else x - GAP_WIDTH
+            gap_y = y + BOX_HEIGHT if dy > 0 else y - GAP_HEIGHT
+            slant = '\\' if dx == dy else '/'
+            for line in range(GAP_HEIGHT):
+                # The line runs from the corner of one box to the facing corner of the other
+                step = line if dx == dy else GAP_HEIGHT - 1 - line
+                self.write(gap_x + 1 + step, gap_y + line, slant)
+
+    def get_name_lines(self, room_id):
+        """
+        This function splits a Room's name into the lines written inside its box.
+        """
+        lines = textwrap.wrap(self.room_map.rooms[room_id].name, BOX_WIDTH - 2) or ['']
+        return (lines + [''] * (BOX_HEIGHT - 2))[:BOX_HEIGHT - 2]
+
+    def get_text(self):
+        """
+        This function returns the canvas as lines of text, joining it again only if something was drawn since.
+        """
+        if self.text is None:
+            self.text = '\n'.join(''.join(row) for row in self.cells)
+        return self.text
+
+    def get_label(self, room_id):
+        """
+        This function returns where a Room's name is written on the canvas.
+
+        Returns
+        -------
+        : List of [row, column, text], in the same form as the hand-drawn maps' labels
+        """
+        x, y = self.corner(room_id)
+        labels = []
+        for line, text in enumerate(self.get_name_lines(room_id)):
+            if text:
+                column = x + 1 + (BOX_WIDTH - 2 - len(text)) // 2
+                labels.append([y + 1 + line, column, text])
+        return labels
@@ -0,0 +1,80 @@
+# Error codes a Command can carry, and the message shown to the player for each. "{}" is filled with Command.obj
+ERROR_MESSAGES = {
+    'invalid_command': "Error. Invalid command passed.",
+    'bad_command': "Bad command passed.",
+    'no_direction': "Error. Invalid room name or direction given.",
+    'invalid_direction': "Invalid room name or direction given.",
+    'invalid_look': "Error. Cannot look at invalid object.",
+    'use_too_few': "Too few arguments passed with use command.",
+    'use_invalid': "Error. Invalid objects passed.",
+    'use_too_many': "Error. Too many arguments with use command.",
+    'drop_none': "Error. Invalid or no item to drop.",
+    'drop_invalid': "Error. Cannot drop {}",
+    'take_none': "Invalid item name.",
+    'take_invalid': "Invalid object cannot be taken.",
+    'take_too_many': "Error. Too many arguments passed.",
+    'look_missing': "You do not see a {} in this room.",
+    'take_missing': "That is not an item you can take.",
+    'drop_missing': "That item is not in your inventory.",
+    'use_no_feature': "There is no {} in the room.",
+    'use_no_item': "There is no {} in the inventory.",
+    'ambiguous': "Which do you mean: {}?"
+}
+
+
+class Command:
+    """ Class used to represent one parsed line of player input
+
+    Attributes
+    ----------
+        verb - The command to carry out ('move', 'look', 'take', 'drop', 'use', 'help', 'map', ...). None on error
+        obj - The direction, item, feature or help topic the command acts on. None if not given
+        target - The feature an item is used on (use command only). None otherwise
+        error - A key of ERROR_MESSAGES if the input could not be parsed. None for a valid command
+        corrections - Tuple of (typed word, corrected word) pairs applied by the spell corrector
+
+    Methods
+    -------
+    is_valid():
+        returns True when the command parsed without error
+    get_error_message():
+        returns the player-facing message for the error code
+    """
+
+    def __init__(self, verb=None, obj=None, target=None, error=None, corrections=()):
+        self.verb = verb
+        self.obj = obj
+        self.target = target
+        self.error = error
+        self.corrections = corrections
+
+    def __repr__(self):
+        return 'Command(verb={!r}, obj={!r}, target={!r}, error={!r})'.format(self.verb, self.obj, self.target,
+                                                                              self.error)
+
+    def __eq__(self, other):
+        if not isinstance(other, Command):
+            return NotImplemented
+        return (self.verb, self.obj, self.target, self.error) == (other.verb, other.obj, other.target, other.error)
+
+    @classmethod
+    def invalid(cls, error, obj=None):
+        """
+        This function builds a Command that failed to parse.
+
+        Parameters
+        ----------
+        error - A key of ERROR_MESSAGES
+        obj - The offending word, if the message refers to it
+
+        Returns
+        -------
+        : Command with no verb and the error code set
+        """
+        return cls(obj=obj, error=error)
+
+    def is_valid(self):
+        return self.error is None
+
+    def get_error_message(self):
+        return ERROR_MESSAGES[self.error].format(self.obj)
@@ -0,0 +1,146 @@
+try:
+    import readline
+except ImportError:
+    # readline isn't available on every platform (e.g. Windows). The game still runs, just without tab-completion
+    readline = None
+
+from languageParser.prefixTrie import PrefixTrie
+
+
+class Completer:
+    """ Class that provides readline tab-completion and history for the command prompt
+
+    Completions come from a PrefixTrie holding the parser's verbs, which never change, plus the names in scope: the
+    current room's exits, items and features and the inventory's items. update() is called before each prompt and only
+    touches the trie when the room or inventory has changed, adding and removing just the names that differ.
+
+    Attributes
+    ----------
+        trie - PrefixTrie of every completable word and name
+        scope - Set of the room and inventory names currently in the trie
+        scope_key - The (room id, room version stamps, inventory version) the scope was built for
+        matches - The completions found for the Tab press in progress
+
+    Methods
+    -------
+    install():
+        registers the completer with readline, if readline is available
+    update():
+        brings the names in scope up to date with the current room and inventory
+    find_matches():
+        returns the completions for the word being typed
+    complete():
+        readline completion callback
+    """
+    # How many words before the cursor can belong to one name (e.g. "servant bathroom" is two)
+    max_phrase_words = 4
+
+    def __init__(self, verbs):
+        self.trie = PrefixTrie(verbs)
+        self.scope = set()
+        self.scope_key = None
+        self.matches = []
+
+    def install(self):
+        """
+        This function makes Tab complete commands at input() prompts. Lines entered are kept in readline's history,
+        so the arrow keys recall earlier commands.
+
+        Returns
+        -------
+        : True if readline was available
+        """
+        if readline is None:
+            return False
+
+        readline.set_completer(self.complete)
+        # Only spaces and the command separators split words, so names with apostrophes ("servant's bathroom")
+        # complete as one word
+        readline.set_completer_delims(' ,;')
+        if 'libedit' in (readline.__doc__ or ''):
+            readline.parse_and_bind('bind ^I rl_complete')
+        else:
+            readline.parse_and_bind('tab: complete')
+
+        return True
+
+    def update(self, rooms_list, hero, inventory):
+        """
+        This function adds names that came into scope to the trie and removes names that went out of it.
+
+        Parameters
+        ----------
+        rooms_list - A copy of each room in the house
+        hero - a copy of the hero (for getting the room location)
+        inventory - the Game inventory
+
+        Returns
+        -------
+        Nothing
+        """
+        current_room = rooms_list[hero.location]
+        key = (hero.location, current_room.directions_version, current_room.contents.version,
+               inventory.contents.version)
+        if key == self.scope_key:
+            return
+
+        scope = set(current_room.get_exit_aliases(rooms_list))
+        scope.update(current_room.contents.entries)
+        scope.update(inventory.contents.entries)
+
+        for name in self.scope - scope:
+            self.trie.remove(name)
+        for name in scope - self.scope:
+            self.trie.insert(name)
+
+        self.scope = scope
+        self.scope_key = key
+
+    def find_matches(self, line, text):
+        """
+        This function finds the completions for the word under the cursor. The words before it are tried as the start
+        of a multi-word name first, so "go downstairs ba" completes to "bathroom".
+
+        Parameters
+        ----------
+        line - The input line up to the cursor
+        text - The word readline will replace (the part of line after the last space)
+
+        Returns
+        -------
+        : list of replacements for text
+        """
+        # Only the command after the last separator matters ("take key, go down" -> "go down")
+        for separator in ',;':
+            line = line.rpartition(separator)[2]
+        words = line.lower().split(' ')
+
+        for start in range(max(0, len(words) - self.max_phrase_words), len(words)):
+            prefix = ' '.join(words[start:])
+            found = self.trie.complete(prefix)
+            if found:
+                # Readline only replaces the last word, so drop the words that are already typed
+                typed = len(prefix) - len(text)
+                return [name[typed:] for name in found]
+
+        return []
+
+    def complete(self, text, state):
+        """
+        This function is called by readline with state 0, 1, 2... until it returns None.
+
+        Parameters
+        ----------
+        text - The word under the cursor
+        state - Index of the completion wanted
+
+        Returns
+        -------
+        : the completion, or None when there are no more
+        """
+        if state == 0:
+            self.matches = self.find_matches(readline.get_line_buffer()[:readline.get_endidx()], text)
+
+        if state < len(self.matches):
+            return self.matches[state]
+        return None
@@ -0,0 +1,194 @@
+import json
+import os
+from languageParser.command import Command
+
+# The grammar shipped with the game, kept next to this module so it is found from any working directory
+GRAMMAR_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'grammar.json')
+
+# The vocabulary an argument slot must come from. 'exit' and 'any' accept every phrase
+SLOT_VOCABULARY = {'object': 'objects', 'exit': None, 'any': None}
+
+
+class VerbRule:
+    """ Class holding one compiled verb entry from the grammar file
+
+    Attributes
+    ----------
+        verb - The verb the Command is given ('move', 'look', 'use', ...). Several rules can share a verb
+        words - The words the player can type for this rule
+        slots - The vocabulary each argument must come from: 'object', 'exit' or 'any'
+        required - Number of leading slots that must be filled (slots marked "?" in the file are optional)
+        prepositions - Dictionary of each preposition this verb understands to the slot the next word goes in
+        aliases - Dictionary of argument words to the word the Command should carry instead, for this verb only
+        swap_first - Words that swap the two arguments when typed first ("pry plank prybar")
+        errors - Dictionary of 'missing', 'invalid', 'extra' and 'unrecognised' to the error code reported
+    """
+
+    def __init__(self, entry, aliases):
+        self.verb = entry['verb']
+        self.words = tuple(entry['words'])
+        self.slots = tuple(slot.rstrip('?') for slot in entry['slots'])
+        self.required = sum(1 for slot in entry['slots'] if not slot.endswith('?'))
+        self.prepositions = dict(entry.get('prepositions', {}))
+        self.aliases = dict(aliases, **entry.get('aliases', {}))
+        self.swap_first = frozenset(entry.get('swap_first', ()))
+        self.errors = dict(entry.get('errors', {}))
+
+
+class Grammar:
+    """ Class that loads the command grammar from a data file and matches segmented input against it
+
+    The file declares the vocabulary, each verb with its words, argument slots, prepositions, aliases and error
+    codes, the verb used when a direction or room is typed on its own, and rewrites of whole commands ("time").
+    Loading compiles it into verb_table, so matching a command is one dictionary lookup for the verb and one per
+    word after it. Adding a verb or a synonym only needs a change to the file.
+
+    Attributes
+    ----------
+        vocabulary - Dictionary of 'objects', 'directions' and 'rooms' to frozensets of phrases. 'objects' also holds
+                     the last word of each multi-word object
+        rules - List of VerbRule, in file order
+        verb_table - Dictionary of every verb word to its VerbRule
+        implicit_rule - VerbRule applied to a lone word from implicit_words
+        implicit_words - Frozenset of the words that are a whole command on their own (directions and rooms)
+        prepositions - Frozenset of every preposition used by any verb. Ones a verb doesn't use are skipped
+        rewrites - Dictionary of a first word to the phrases it stands for
+
+    Methods
+    -------
+    load():
+        reads and compiles a grammar file
+    words_for():
+        returns every word that can be typed for a verb
+    match():
+        turns the phrases of one line into a Command
+    """
+
+    def __init__(self, data):
+        vocabulary = data['vocabulary']
+        objects = list(vocabulary['objects'])
+
+        # The last word of a multi-word object ("horse" for "rocking horse") is accepted on its own. The parser works
+        # out which object in the room or inventory it means
+        objects += [phrase.split()[-1] for phrase in objects if ' ' in phrase]
+
+        self.vocabulary = {'objects': frozenset(objects),
+                           'directions': frozenset(vocabulary['directions']),
+                           'rooms': frozenset(vocabulary['rooms'])}
+
+        self.rules = [VerbRule(entry, data.get('aliases', {})) for entry in data['verbs']]
+        self.verb_table = {}
+        for rule in self.rules:
+            for word in rule.words:
+                self.verb_table[word] = rule
+
+        implicit = data['implicit']
+        self.implicit_rule = next(rule for rule in self.rules if rule.verb == implicit['verb'])
+        self.implicit_words = frozenset().union(*(self.vocabulary[name] for name in implicit['vocabulary']))
+
+        self.prepositions = frozenset(word for rule in self.rules for word in rule.prepositions)
+        self.rewrites = {word: tuple(phrases) for word, phrases in data.get('rewrites', {}).items()}
+
+    @classmethod
+    def load(cls, path=GRAMMAR_FILE):
+        """
+        This function reads a grammar file and compiles it.
+
+        Parameters
+        ----------
+        path - The JSON grammar file. Defaults to the one shipped with the parser
+
+        Returns
+        -------
+        : Grammar
+        """
+        with open(path, 'r', encoding='utf-8') as grammar_file:
+            return cls(json.load(grammar_file))
+
+    def words_for(self, *verbs):
+        """
+        This function lists the words that can be typed for the given verbs, across every rule for them.
+        """
+        return [word for rule in self.rules if rule.verb in verbs for word in rule.words]
+
+    def match(self, phrases, typed_words):
+        """
+        This function matches the phrases of one line against the grammar in a single left-to-right pass. The first
+        phrase picks the rule. Each later phrase either fills the next free slot, fills the slot its preposition
+        points at (moving anything already there to the next free slot), or is skipped if it is a preposition the
+        verb doesn't use. Words after the last slot are extra.
+
+        Parameters
+        ----------
+        phrases - The known phrases the player typed, in order
+        typed_words - How many words the player typed, known or not
+
+        Returns
+        -------
+        : Command with the verb and arguments, or an error code. 'exit' arguments are returned as typed, for the
+        caller to check against the current room
+        """
+        if not phrases:
+            return Command.invalid('invalid_command')
+
+        if phrases[0] in self.rewrites:
+            phrases = list(self.rewrites[phrases[0]]) + phrases[1:]
+
+        rule = self.verb_table.get(phrases[0])
+        arguments = phrases[1:]
+
+        if rule is None:
+            if len(phrases) == 1 and phrases[0] in self.implicit_words:
+                rule, arguments = self.implicit_rule, phrases
+            else:
+                return Command.invalid('bad_command')
+
+        values = [None] * len(rule.slots)
+        extra = False
+        pointed_slot = None
+
+        for phrase in arguments:
+            if phrase in rule.prepositions:
+                pointed_slot = rule.prepositions[phrase]
+                continue
+            elif phrase in self.prepositions:
+                continue
+
+            free_slot = next((i for i, value in enumerate(values) if value is None), None)
+
+            if pointed_slot is not None:
+                if values[pointed_slot] is not None:
+                    if free_slot is None:
+                        extra = True
+                        continue
+                    values[free_slot] = values[pointed_slot]
+                values[pointed_slot] = phrase
+                pointed_slot = None
+            elif free_slot is not None:
+                values[free_slot] = phrase
+            else:
+                extra = True
+
+        filled = [value for value in values if value is not None]
+
+        if len(filled) < rule.required:
+            return Command.invalid(rule.errors['missing'])
+
+        elif not filled and typed_words > 1 and 'unrecognised' in rule.errors:
+            return Command.invalid(rule.errors['unrecognised'])
+
+        elif extra and 'extra' in rule.errors:
+            return Command.invalid(rule.errors['extra'])
+
+        for slot, value in zip(rule.slots, values):
+            vocabulary = SLOT_VOCABULARY[slot]
+            if value is not None and vocabulary is not None and value not in self.vocabulary[vocabulary]:
+                return Command.invalid(rule.errors['invalid'], value)
+
+        if len(filled) == 2 and filled[0] in rule.swap_first:
+            filled.reverse()
+
+        filled = [rule.aliases.get(value, value) for value in filled]
+        filled += [None] * (2 - len(filled))
+
+        return Command(rule.verb, filled[0], filled[1])
@@ -1,5 +1,13 @@
+import re
 import textwrap
-import sys
+import types
+from languageParser import phraseTrie
+from languageParser.completer import Completer
+from languageParser.spellCorrector import SpellCorrector
+from languageParser.command import Command
+from languageParser.grammar import Grammar
+from Layout import layout
+from LRUCache import LRUCache
 
 
 class LanguageParser:
@@ -9,411 +17,418 @@ class LanguageParser:
     ----------
         move_words - Holds all the valid commands to move the player throughout the house
         look_words - Holds all the valid commands to look at objects in the house
-        look_objects - Holds all the valid items a player could look at
-        tw_look_objects - Holds all the two word items a player can interact with (used for building strings)
+        look_objects - Holds all the valid items a player could look at, plus the last word of each multi-word item
         take_words - Holds all the valid commands to take objects in the game
         use_words - Holds all the valid commands to use objects n the game
         drop_words - Holds all the valid commands to drop items in the game
         move_directions - Holds all the valid directions a player could move in the game
         move_rooms - Holds all the valid rooms a player can walk to in the game
-        tw_rooms - Holds all the valid two word rooms a player can move in the game (used for building strings)
+        prepositions - Holds the words that point an argument at a slot ("on", "into", "with")
         other_commands - Holds any one-word commands that don't require items or directions
+        grammar - Grammar compiled from grammar.json. The lists above are taken from it
+        token_index - Read-only map of every vocabulary word to the categories (attribute names above) it belongs to
+        phrases - PhraseTrie over the whole vocabulary, used to pick multi-word names out of the input
+        spelling - SpellCorrector over every word of the vocabulary, used to rescue misspelled commands
+        parse_cache - LRUCache of parsed Commands keyed by the input words, room and that room's exits version.
+                      Its hits and misses counters show how often parsing is skipped
+        completer - Completer providing tab-completion at the prompt. Created by the first read_commands() call
 
     Methods
     -------
     __init__():
-        establishes the string dictionaries for the language parser
-    parse_args():
-        checks player's input for valid commands and handles the input command
+        loads the grammar and takes the string dictionaries for the language parser from it
+    compile_vocabulary():
+        freezes each word category into a set and builds the token index, phrase trie and spell corrector
+    read_commands():
+        reads a line of the player's input and splits it into commands
+    split_commands():
+        splits a line on ";", "," and "then"
+    parse_command():
+        parses one command and reports any error
+    parse():
+        parses one line of input into a Command without any I/O, using the parse cache
+    parse_words():
+        parses the lowercased words of one line into a Command, retrying with spelling corrections if it fails
+    parse_phrases():
+        matches the lowercased words of one line against the grammar
+    scope_command():
+        checks a Command's items and features against the current room and inventory
+    resolve_name():
+        finds the one item or feature in scope that a word refers to
+    correct_spelling():
+        replaces words outside the vocabulary with their closest vocabulary word
+    parse_batch():
+        parses an iterable of lines into a list of Commands
     parse_move():
-        handles the movement logic and language processing for the move command
-    parse_look():
-        handles the arguments for the look command
-    parse_use():
-        handles the arguments for the use command
-    parse_drop():
-        handles the arguments for the drop command
-    parse_take():
-        handles the arguments for the take command
+        checks the direction or room name of a move command against the current room's exits
     get_help():
         displays a help guide for the user
     """
     def __init__(self):
-        # Dictionaries for each of the possible directions and rooms to move to.
-        self.move_words = ["go", "walk", "move", "jaunt", "run", "step", "stroll", "march", "travel", "proceed",
-                           "sprint", "jog"]
-
-        self.look_words = ["look", "glance", "eye", "peak", "view", "stare", "peer", "study", "examine", "read"]
-
-        self.look_objects = ["windowsill", "crystal", "corner", "east window", "south window", "west window", "toys",
-                             "prybar", "pry bar", "ashes", "workbench", "shelves", "box", "padlock", "coffin",
-                             "undead chef", "painting", "dog", "table", "mirror", "armor", "clock", "stone", "shears",
-                             "garden", "tree", "grave tree", "fireplace", "pool", "window", "plank", "axe", "vision",
-                             "bed", "glint", "chef", "knife", "drawer", "sink", "key", "piano", "book", "bookcase",
-                             "north window", "pistol", "apparition", "sack", "pocketwatch", "pocket watch",
-                             "poltergeist", "couch", "fireplace", "table", "easel", "loom", "left gargoyle", 
-                             "right gargoyle", "paint", "music box", "bed", "rocking horse", "rose", "spade", 
-                             "fountain", "roses", "hair", "door lock", "shelf", "toilet", "sink", "mirror", "journal", 
-                             "locket", "vine", "window", "statue", "tile", "hollow", "grave", "girl", "lock", 
-                             "paintbrush", "grill", "tub", "windows", "chairs", "tables", "small bed", "drawers", 
-                             "pool", "books", "ghost"]
-
-        self.tw_look_objects = ["window", "sill", "east", "window", "west", "south", "pry", "bar", "pad", "lock",
-                                "undead", "chef", "grave", "tree", "book", "case", "north", "pocket", "watch", "left",
-                                "right", "gargoyle", "music", "box", "rocking", "horse", "door", "lock", "small", "bed"]
-
-        self.take_words = ["grab", "seize", "lift", "take"]
-
-        self.use_words = ["use", "apply", "put", "pry", "unlock"]
-
-        self.drop_words = ["drop", "remove", "dump", "release"]
-
-        self.move_directions = ["north", "south", "east", "west", "up", "down", "southwest", "southeast",
-                                "northwest", "northeast", "down hole", "door"]
-
-        self.move_rooms = ["solarium", "game room", "kitchen", "dining room", "bathroom", "library",
-                           "foyer", "parlor", "porch", "cellar", "servant quarters", "crypt",
-                           "servant's bathroom", "dark tunnel", "red room", "child's room", "pink room",
-                           "art studio", "green room", "master's quarters", "landing", "linen closet",
-                           "upstairs", "downstairs", "attic", "hidden room", "gardens", "gazebo",
-                           "rose garden", "downstairs bathroom", "landing", "front lawns",
-                           "upstairs bathroom"]
-
-        self.tw_rooms = ["game", "room", "dining", "servant", "quarters", "bathroom", "dark",
-                         "tunnel", "red", "green", "master's", "linen", "closet", "hidden", "rose",
-                         "garden", "down", "hole", "downstairs", "bathroom", "front", "lawns",
-                         "upstairs", "pink"]
-
-        self.other_commands = ["map", "inventory", "exit", "help", "save", "time", "play"]
-
-    def parse_args(self, rooms_list, hero):
+        # Verbs, vocabulary, prepositions, aliases and rewrites all come from the grammar file
+        self.grammar = Grammar.load()
+
+        self.move_words = self.grammar.words_for("move")
+        self.look_words = self.grammar.words_for("look")
+        self.look_objects = self.grammar.vocabulary["objects"]
+        self.take_words = self.grammar.words_for("take")
+        self.use_words = self.grammar.words_for("use")
+        self.drop_words = self.grammar.words_for("drop")
+        self.move_directions = self.grammar.vocabulary["directions"]
+        self.move_rooms = self.grammar.vocabulary["rooms"]
+        self.prepositions = self.grammar.prepositions
+        self.other_commands = self.grammar.words_for("map", "inventory", "exit", "help", "save", "play") + \
+            list(self.grammar.rewrites)
+
+        # Hash every word once so classifying a token doesn't depend on how large the vocabulary grows
+        self.compile_vocabulary()
+
+        self.parse_cache = LRUCache(self.parse_cache_size)
+        self.completer = None
+
+    # Separators between the commands on one line of input
+    command_separators = re.compile(r'[;,]|\bthen\b', re.IGNORECASE)
+
+    # Maximum number of parsed commands remembered by parse()
+    parse_cache_size = 512
+
+    # Names of the attributes above that hold parser vocabulary
+    vocabulary_categories = ("move_words", "look_words", "look_objects", "take_words", "use_words", "drop_words",
+                             "move_directions", "move_rooms", "prepositions", "other_commands")
+
+    def compile_vocabulary(self):
         """
-        This function takes and parses the user's input. The first valid word is the command, which is used to
-        call the appropriate parse_command function.
+        This function replaces each vocabulary list with a frozenset (dropping duplicates) and builds token_index, a
+        read-only dictionary mapping each word to the frozenset of categories it appears in. Every entry is also added
+        to the phrase trie so names of any length are matched the same way.
+
+        Returns
+        -------
+        Nothing
+        """
+        index = {}
+
+        for category in self.vocabulary_categories:
+            words = frozenset(getattr(self, category))
+            setattr(self, category, words)
+
+            for word in words:
+                index.setdefault(word, set()).add(category)
+
+        self.token_index = types.MappingProxyType({word: frozenset(cats) for word, cats in index.items()})
+        self.phrases = phraseTrie.PhraseTrie(self.token_index)
+        self.spelling = SpellCorrector(word for phrase in self.token_index for word in phrase.split())
+
+    def read_commands(self, rooms_list, hero, inventory=None):
+        """
+        This function prompts the player for a line of input and splits it into the commands it holds, so
+        "go up, take crystal then go down" is entered at one prompt.
 
         Parameters
         ----------
         rooms_list - A copy of each room in the house
         hero - a copy of the hero
+        inventory - the Game inventory, for completing the names of items in scope
 
         Returns
         -------
-        : command, which is a dictionary with all the valid words the player typed, parsed by the appropriate
-        parse_command function.
+        : list of the command strings on the line, in order. An empty line gives one empty command
         """
 
-        # Get user input. Make it lowercase and split it.
+        # Set up tab-completion on first use, then bring its names in line with the current room and inventory
+        if self.completer is None:
+            self.completer = Completer(self.move_words | self.look_words | self.take_words | self.use_words |
+                                       self.drop_words | self.other_commands)
+            self.completer.install()
+        if inventory is not None:
+            self.completer.update(rooms_list, hero, inventory)
+
+        # Get user input.
         print()
-        split_args = input('                    > ').lower().split()
+        return self.split_commands(input(layout.indent + '> '))
 
-        command = []  # holds the parsed commands
+    def split_commands(self, text):
+        """
+        This function splits a line of input on the command separators (";", "," and the word "then").
 
-        # Pick out only the valid words
-        for i in split_args:
-            if i in self.move_directions or i in self.move_rooms or i in self.tw_rooms or \
-                    i in self.move_words or i in self.look_words or i in self.tw_look_objects or \
-                    i in self.take_words or i in self.look_objects or i in self.drop_words or \
-                    i in self.other_commands or i in self.use_words:
-                command.append(i)
+        Parameters
+        ----------
+        text - The line the player typed
 
-        # Print an error if no words were valid.
-        if len(command) == 0:
-            self.print_output("Error. Invalid command passed.")
-            return "badcommand"
+        Returns
+        -------
+        : list of the non-blank commands, or [text] if there are none so the line is still reported as invalid
+        """
+        commands = [segment for segment in self.command_separators.split(text) if segment.strip()]
+        return commands or [text]
 
-        elif len(command) == 1 and (command[0] in self.move_directions or command[0] in self.move_rooms):
-            command.append(command[0])
-            self.parse_move(command, hero, rooms_list)
+    def parse_command(self, text, rooms_list, hero, inventory=None):
+        """
+        This function parses one command with parse() and prints the error message if it wasn't valid, along with
+        any spelling corrections that were made.
 
-        elif len(command) == 2 and command[0] in self.tw_rooms and command[1] in self.tw_rooms:
-            command.insert(0, "move")
-            self.parse_move(command, hero, rooms_list)
+        Parameters
+        ----------
+        text - One command from read_commands()
+        rooms_list - A copy of each room in the house
+        hero - a copy of the hero
+        inventory - the Game inventory, for checking the items a command refers to
 
-        elif command[0] in self.move_words:
-            command = self.parse_move(command, hero, rooms_list)
+        Returns
+        -------
+        : Command holding the parsed verb and arguments, or an error code if the input was invalid.
+        """
+        command = self.parse(text, rooms_list, hero, inventory)
 
-        elif command[0] in self.look_words:
-            command = self.parse_look(command, split_args)
+        if not command.is_valid():
+            self.print_output(command.get_error_message())
 
-        elif command[0] in self.use_words:
-            command = self.parse_use(command)
+        for typed, corrected in command.corrections:
+            self.print_output('(Taking "{}" to mean "{}".)'.format(typed, corrected))
 
-        elif command[0] in self.drop_words:
-            command = self.parse_drop(command)
+        return command
 
-        elif command[0] in self.take_words:
-            command = self.parse_take(command)
+    def parse(self, text, rooms_list, hero, inventory=None):
+        """
+        This function parses one line of player input without reading or printing anything. Repeated input in the
+        same room is answered from the parse cache. The key includes the room's directions_version and the room and
+        inventory contents versions, so entries made before a task opened a new exit or an item moved are never
+        reused. Cached Commands are shared and must not be modified.
 
-        elif command[0] == "exit":
-            sys.exit(0)
+        Parameters
+        ----------
+        text - The line the player typed
+        rooms_list - A copy of each room in the house (for resolving room names)
+        hero - a copy of the hero (for getting the room location)
+        inventory - the Game inventory. When given, items and features are checked against the current room and
+                    inventory. When None, only the vocabulary is checked
 
-        elif command[0] == "help":
-            self.get_help(command)
+        Returns
+        -------
+        : Command holding the parsed verb and arguments, or an error code if the input was invalid.
+        """
 
-        elif command[0] == "time":
-            command[0] = "look"
-            command.append("pocketwatch")
-            self.parse_look(command, split_args)
+        # Make the input lowercase and split it.
+        split_args = text.lower().split()
 
-        elif command[0] not in self.other_commands:
-            self.print_output("Bad command passed.")
-            return "badcommand"
+        current_room = rooms_list[hero.location]
+        key = (tuple(split_args), hero.location, current_room.directions_version, current_room.contents.version,
+               inventory.contents.version if inventory is not None else None)
+        command = self.parse_cache.get(key)
+
+        if command is None:
+            command = self.parse_words(split_args, rooms_list, hero, inventory)
+            self.parse_cache.put(key, command)
 
-        # Return the parsed command.
         return command
 
-    def parse_move(self, command, hero, rooms_list):
+    def parse_words(self, split_args, rooms_list, hero, inventory=None):
         """
-        This function handles the movement logic based on the input string parameters
+        This function parses the words of one line of input. If that fails, misspelled words are corrected and the
+        corrected words are parsed instead. The correction is only kept if it produces a valid command, so ordinary
+        words that happen to be close to the vocabulary can't break a command that was already valid.
+
+        Parameters
         ----------
-        command - the valid words the user entered
+        split_args - The lowercased words the player typed
+        rooms_list - A copy of each room in the house (for resolving room names)
         hero - a copy of the hero (for getting the room location)
-        rooms_list - a copy of each room in the game (for getting the valid rooms a player can move to)
+        inventory - the Game inventory, or None to only check the vocabulary
 
         Returns
         -------
-        command - the parsed argument with either a valid direction or a bad command, which throws an error.
+        : Command holding the parsed verb and arguments, or an error code if the input was invalid.
         """
-        command[0] = "move"
-        dir_name = []  # holds valid directions and the corresponding room names
-
-        # Get the room list for matching strings
         current_room = rooms_list[hero.location]
+        command = self.scope_command(self.parse_phrases(split_args, rooms_list, hero), current_room, inventory)
 
-        # Add the direction and room name to the direction_name list
-        for i in self.move_directions:
-            if i in current_room.directions:
-                dir_name.append(i)
-                dir_name.append(rooms_list[current_room.directions[i]].name.lower())
-
-        # Print an error if no room was provided.
-        if len(command) <= 1:
-            self.print_output("Error. Invalid room name or direction given.")
-            return "badcommand"
-
-        else:
-            # Check to see if it's a one-word named room
-            if command[1] in dir_name:
-                # Get the index of the correct room
-                idx = dir_name.index(command[1])
+        if not command.is_valid():
+            corrected_args, corrections = self.correct_spelling(split_args)
 
-                # If the index is even, it's already a direction
-                if idx % 2 != 0:
-                    # Otherwise get the index of the direction.
-                    command[1] = dir_name[idx - 1]
+            if corrections:
+                corrected = self.scope_command(self.parse_phrases(corrected_args, rooms_list, hero), current_room,
+                                               inventory)
+                if corrected.is_valid():
+                    corrected.corrections = tuple(corrections)
+                    return corrected
 
-            # Check to see if it's a two-word room
-            # and both are in the two-word room dictionary
-            elif len(command) == 3 and command[1] in self.tw_rooms and command[2] in self.tw_rooms:
-
-                # Concatenate the strings for further parsing
-                two_words = command[1] + ' ' + command[2]
+        return command
 
-                # Set the command if the concatenated words are valid.
-                if two_words in dir_name:
-                    command[1] = two_words
+    def correct_spelling(self, split_args):
+        """
+        This function replaces each word that isn't part of the vocabulary with its closest vocabulary word, when
+        there is a single closest word within reach.
 
-                    # Get the index of the valid room or direction.
-                    idx = dir_name.index(two_words)
+        Parameters
+        ----------
+        split_args - The lowercased words the player typed
 
-                    # If it's even, it's already a direction.
-                    if idx % 2 != 0:
-                        # Otherwise grab the index of the correct direction.
-                        command[1] = dir_name[idx - 1]
+        Returns
+        -------
+        : the corrected list of words, and a list of (typed word, corrected word) pairs
+        """
+        corrected_args = []
+        corrections = []
 
-            # Print an error if an invalid room name was passed.
+        for word in split_args:
+            correction = self.spelling.correct(word)
+            if correction is None:
+                corrected_args.append(word)
             else:
-                self.print_output("Invalid room name or direction given.")
-                return "badcommand"
+                corrected_args.append(correction)
+                corrections.append((word, correction))
 
-        return command
+        return corrected_args, corrections
 
-    def parse_look(self, command, split_args):
+    def scope_command(self, command, current_room, inventory):
         """
-        This function handles the logic for the look command
+        This function checks that the items and features a valid Command refers to are where the verb needs them:
+        looked at things in the room or inventory, taken things in the room, dropped and used items in the inventory
+        and used-on features in the room. A word that only names part of an object ("horse") is replaced by the full
+        name ("rocking horse").
+
+        Parameters
         ----------
-        command - the valid words the user entered
-        split_args - all the words the player entered. Used for checking the number of items the player entered.
+        command - A Command returned by parse_phrases()
+        current_room - The Room the hero is in
+        inventory - the Game inventory. If None the Command is returned unchanged
 
         Returns
         -------
-        command - the parsed argument with the item or feature the player will look at. Returns badcommand if the item
-        is invalid or cannot be looked at.
+        : Command with full object names, or an error if an object isn't in scope or the word fits several objects
         """
+        if inventory is None or not command.is_valid() or command.obj is None:
+            return command
+
+        if command.verb == 'look':
+            obj, error = self.resolve_name(command.obj, (current_room.contents, inventory.contents), 'look_missing')
+        elif command.verb == 'take':
+            obj, error = self.resolve_name(command.obj, (current_room.contents,), 'take_missing')
+        elif command.verb == 'drop':
+            obj, error = self.resolve_name(command.obj, (inventory.contents,), 'drop_missing')
+        elif command.verb == 'use':
+            target, error = self.resolve_name(command.target, (current_room.contents,), 'use_no_feature')
+            if error is not None:
+                return error
+            obj, error = self.resolve_name(command.obj, (inventory.contents,), 'use_no_item')
+            if error is not None:
+                return error
+            return Command('use', obj, target)
+        else:
+            return command
 
-        if len(command) == 1:
-            command[0] = "look"
+        if error is not None:
+            return error
+        return Command(command.verb, obj)
 
-            if len(split_args) > 1:
-                self.print_output("Error. Cannot look at invalid object.")
-                return "badcommand"
+    def resolve_name(self, word, indexes, missing_error):
+        """
+        This function finds which item or feature a word refers to.
 
-        elif len(command) == 2:
-            if command[1] not in self.look_objects:
-                self.print_output("Error. Cannot look at invalid object.")
-                return "badcommand"
+        Parameters
+        ----------
+        word - The object word from a Command
+        indexes - The NameIndexes (room contents and/or inventory contents) in scope
+        missing_error - The error code to use if nothing in scope matches
 
-        elif len(command) >= 3:
-            temp_word = command[1] + " " + command[2]
-            if temp_word not in self.look_objects:
-                self.print_output("Error. Cannot look at invalid object.")
-            else:
-                command[1] = temp_word
-                while len(command) > 2:
-                    command.pop()
+        Returns
+        -------
+        : the full name and None, or None and an error Command if nothing or more than one thing matches
+        """
+        names = []
+        for index in indexes:
+            for name in index.resolve(word):
+                if name not in names:
+                    names.append(name)
 
+        # A thing with exactly that name wins over things whose name merely ends in it
+        if word in names or len(names) == 1:
+            return (word if word in names else names[0]), None
 
-        if len(command) > 1:
-            if command[1] == "drawers":
-                command[1] = "drawer"
+        elif len(names) > 1:
+            choices = ['the ' + name for name in names]
+            return None, Command.invalid('ambiguous', ', '.join(choices[:-1]) + ' or ' + choices[-1])
 
-        return command
+        return None, Command.invalid(missing_error, word)
 
-    def parse_use(self, command):
+    def parse_phrases(self, split_args, rooms_list, hero):
         """
-        This function parses the valid words for the use command.
+        This function parses the words of one line of input. The known phrases are matched against the grammar in
+        one pass, and a move command's destination is then checked against the current room's exits.
 
         Parameters
         ----------
-        command - The valid words that the player entered.
+        split_args - The lowercased words the player typed
+        rooms_list - A copy of each room in the house (for resolving room names)
+        hero - a copy of the hero (for getting the room location)
 
         Returns
         -------
-        command - the parsed, valid arguments for the use command. Returns a badcommand if invalid items are passed with
-        the use command.
+        : Command holding the parsed verb and arguments, or an error code if the input was invalid.
         """
-        command[0] = "use"
-
-        if len(command) < 3:
-            self.print_output("Too few arguments passed with use command.")
-            return "badcommand"
-
-        elif len(command) == 3:
-            # Check for pry plank command. If so, reverse the order behind-the-scenes for proper operation
-            if command[1] == 'plank':
-                temp = 'plank'
-                command[1] = command[2]
-                command[2] = temp
-            if command[1] not in self.look_objects or command[2] not in self.look_objects:
-                self.print_output("Error. Invalid objects passed.")
-                return "badcommand"
-
-        elif len(command) == 4:
-            if command[1] + " " + command[2] in self.look_objects:
-                command[1] = command[1] + " " + command[2]
-            elif command[2] + " " + command[3] in self.look_objects:
-                command[2] = command[2] + " " + command[3]
-            else:
-                self.print_output("Invalid object passed with use command")
-                return "badcommand"
-            while command > 3:
-                command.pop()
-
-        elif len(command) == 5:
-            if command[1] + " " + command[2] not in self.look_objects:
-                self.print_output("Invalid object passed with use command")
-                return "badcommand"
-            else:
-                command[1] += " " + command[2]
 
-            if command[3] + " " + command[4] not in self.look_objects:
-                self.print_output("Invalid object passed with use command")
-                return "badcommand"
-            else:
-                command[2] = command[3] + " " + command[4]
+        # Pick out only the valid words, joining multi-word names into a single entry
+        command = self.grammar.match(self.phrases.segment(split_args), len(split_args))
 
-        else:
-            self.print_output("Error. Too many arguments with use command.")
-            return "badcommand"
+        if command.verb == "move":
+            return self.parse_move(command.obj, hero, rooms_list)
 
         return command
 
-    def parse_drop(self, command):
+    def parse_batch(self, lines, rooms_list, hero, inventory=None):
         """
-        This function parses the items for the drop command.
+        This function parses many lines of input against the same game state, e.g. to replay a recorded session.
+
         Parameters
         ----------
-        command - All the valid words the player entered.
+        lines - Any iterable of input lines
+        rooms_list - A copy of each room in the house
+        hero - a copy of the hero
+        inventory - the Game inventory, or None to only check the vocabulary
 
         Returns
         -------
-        command - the parsed result of the items for the drop command. badcommand is returned if the item cannot be
-        dropped.
+        : list of Command, one per line
         """
-        command[0] = "drop"
-
-        if len(command) == 1:
-            self.print_output("Error. Invalid or no item to drop.")
-            return "badcommand"
-
-        if len(command) == 2:
-            if command[1] not in self.look_objects:
-                self.print_output("Error. Cannot drop " + command[1])
-                return "badcommand"
-
-        elif len(command) > 2:
-            temp_word = command[1] + " " + command[2]
-            if temp_word not in self.look_objects:
-                self.print_output("Error. Invalid item cannot be dropped.")
-                return "badcommand"
-            else:
-                command[1] = temp_word
-                while len(command) > 2:
-                    command.pop()
+        return [self.parse(line, rooms_list, hero, inventory) for line in lines]
 
-        return command
-
-    def parse_take(self, command):
+    def parse_move(self, destination, hero, rooms_list):
         """
-        This function parses the arguments for the take command.
-        Parameters
+        This function handles the movement logic based on the input string parameters
         ----------
-        command - All the valid words the player entered.
+        destination - the direction or room name the user entered
+        hero - a copy of the hero (for getting the room location)
+        rooms_list - a copy of each room in the game (for getting the valid rooms a player can move to)
 
         Returns
         -------
-        command - the parsed, valid items the player can take. Returns badcommand if the item cannot be taken.
+        : Command to move in a valid direction, or an error if the room or direction is invalid.
         """
-        command[0] = "take"
-
-        if len(command) < 2:
-            self.print_output("Invalid item name.")
-            return "badcommand"
-
-        elif len(command) == 2:
-            if command[1] not in self.look_objects:
-                self.print_output("Invalid object cannot be taken.")
-                return "badcommand"
+        # Valid directions and neighbouring room names for the current room, each mapped to its direction
+        exit_aliases = rooms_list[hero.location].get_exit_aliases(rooms_list)
 
-        elif len(command) == 3:
-            if command[1] + " " + command[2] not in self.look_objects:
-                self.print_output("Invalid object cannot be taken.")
-                return "badcommand"
-            else:
-                command[1] += " " + command[2]
-
-        if len(command) > 3:
-            self.print_output("Error. Too many arguments passed.")
-
-        if command[1] == "box":
-            command[1] = "ashes"
+        # Check to see if it's a valid direction or the name of a neighbouring room
+        if destination in exit_aliases:
+            return Command("move", exit_aliases[destination])
 
-        return command
+        # Error if an invalid room name was passed.
+        else:
+            return Command.invalid('invalid_direction')
 
-    def get_help(self, helpList):
+    def get_help(self, topic=None):
         """
         This function prints help for the player on the screen. Displays general help instructions or detailed
         instructions for each action a player can take based on their input.
 
         Parameters
         ----------
-        helpList - Modifiers that will determine which help screen is shown
+        topic - The command to show detailed help for. None shows the general help screen
 
         Returns
         -------
         Nothing
         """
-        if len(helpList) == 1:
+        if topic is None:
             print()
             self.print_output("The goal of the game is to explore the mansion. Through interacting with various objects and features, the player will learn the deep history that surrounds the haunted mansion. Not all clues are helpful! There are many ways to win and lose this game. Can you solve the mystery, or will you meet your demise?")
             print()
@@ -424,7 +439,7 @@ class LanguageParser:
             self.print_output("Valid commands are: take, drop, map, inventory, look, move, and use.")
 
         else:
-            if helpList[1] == 'take':
+            if topic == 'take':
                 print()
                 self.print_output("The take command allows the player to add an item from their environment to their inventory. To call the take function, a player enters a valid take command followed by a valid object in the room.")
                 print()
@@ -441,7 +456,7 @@ class LanguageParser:
                 self.print_output("If the player cannot take the object, there will be a corresponding error message for why they can't take an object.")
                 print()
 
-            elif helpList[1] == 'drop':
+            elif topic == 'drop':
                 print()
                 self.print_output(
                     "The drop command allows the player to drop an item from their inventory to the room they are currently standing in. To call the drop function, a player enters a valid drop command followed by a valid object in their inventory.")
@@ -460,7 +475,7 @@ class LanguageParser:
                 self.print_output("If the player cannot drop the object, there will be a corresponding error message for why they can't drop the object.")
                 print()
 
-            elif helpList[1] == 'map':
+            elif topic == 'map':
                 print()
                 self.print_output("The map command allows a player to print the map for the current floor they're standing on.")
                 print()
@@ -471,7 +486,7 @@ class LanguageParser:
                 self.print_output("For example, if a player were standing on the first floor, they would enter \"Map\", and the current floor's map would print.")
                 print()
 
-            elif helpList[1] == 'inventory':
+            elif topic == 'inventory':
                 print()
                 self.print_output("The inventory command allows a player to display all the items in the player's inventory.")
                 print()
@@ -482,7 +497,7 @@ class LanguageParser:
                 self.print_output("For example, a player would enter \"inventory\", and the contents of the inventory would print to the console.")
                 print()
 
-            elif helpList[1] == 'look':
+            elif topic == 'look':
                 print()
                 self.print_output("The look command allows the player to examine things in their environment to get useful clues about the mansion's history. To call the look function, a player enters a valid look command followed by a valid object in the room or their inventory.")
                 print()
@@ -499,7 +514,7 @@ class LanguageParser:
                 self.print_output("If the player cannot examine the object for some reason, there will be a corresponding error message.")
                 print()
 
-            elif helpList[1] == 'move':
+            elif topic == 'move':
                 print()
                 self.print_output("The move command allows the player to move from room to room. To call the move function, a player enters a valid move command followed by a valid room or direction of an adjoining room.")
                 print()
@@ -516,7 +531,7 @@ class LanguageParser:
                 self.print_output("If the player cannot move for any reason, there will be a corresponding error message.")
                 print()
 
-            elif helpList[1] == 'use':
+            elif topic == 'use':
                 print()
                 self.print_output("The use command allows the player to use an item to interact with another item or feature. To call the use function, a player enters a valid use command followed by two valid objects or features.")
                 print()
@@ -537,6 +552,6 @@ class LanguageParser:
                 self.print_output("Invalid command given to help function. Valid commands are: take, drop, map, inventory, look, move, and use.")
 
     def print_output(self, string):
-        wrappedText = textwrap.wrap(string, width=83)
+        wrappedText = textwrap.wrap(string, width=layout.print_width)
         for i in wrappedText:
-            print("                    " + i)
+            print(layout.indent + i)
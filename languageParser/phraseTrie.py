@@ -0,0 +1,74 @@
+class PhraseTrie:
+    """ Class that stores the parser vocabulary word by word so multi-word names can be found in one pass
+
+    Attributes
+    ----------
+        root - Nested dictionaries keyed by word. A node holding the END key completes a known phrase
+
+    Methods
+    -------
+    insert():
+        adds a phrase (one or more words) to the trie
+    segment():
+        splits the player's words into the longest known phrases, dropping unknown words
+    """
+    END = ''    # marks the end of a phrase. Never produced by str.split(), so it can't collide with a word
+
+    def __init__(self, phrases=()):
+        self.root = {}
+
+        for phrase in phrases:
+            self.insert(phrase)
+
+    def insert(self, phrase):
+        """
+        This function adds a phrase to the trie, one node per word.
+
+        Parameters
+        ----------
+        phrase - A vocabulary entry such as "key" or "downstairs bathroom"
+
+        Returns
+        -------
+        Nothing
+        """
+        node = self.root
+        for word in phrase.split():
+            node = node.setdefault(word, {})
+        node[self.END] = True
+
+    def segment(self, words):
+        """
+        This function walks the player's words from left to right. At each position the longest phrase in the trie is
+        taken and the walk continues after it. Words that don't start any phrase are skipped.
+
+        Parameters
+        ----------
+        words - The player's input, lowercased and split on whitespace
+
+        Returns
+        -------
+        phrases - The known phrases found, in the order they were typed
+        """
+        phrases = []
+        start = 0
+
+        while start < len(words):
+            node = self.root
+            match_end = start
+            position = start
+
+            # Follow the trie as far as the input allows, remembering the last complete phrase seen
+            while position < len(words) and words[position] in node:
+                node = node[words[position]]
+                position += 1
+                if self.END in node:
+                    match_end = position
+
+            if match_end > start:
+                phrases.append(' '.join(words[start:match_end]))
+                start = match_end
+            else:
+                start += 1
+
+        return phrases
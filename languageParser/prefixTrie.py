@@ -0,0 +1,117 @@
+class PrefixTrie:
+    """ Class that stores words and phrases character by character so every entry starting with a prefix can be found
+
+    Entries are reference counted, so the same name can be added by two sources (e.g. a verb and a room) and stays in
+    the trie until both have removed it.
+
+    Attributes
+    ----------
+        root - Nested dictionaries keyed by character. A node's END key holds how many times its entry was added
+
+    Methods
+    -------
+    insert():
+        adds an entry
+    remove():
+        removes an entry added earlier, pruning branches that become empty
+    complete():
+        returns every entry that starts with a prefix
+    """
+    END = ''    # holds the reference count of an entry. Never a single character, so it can't collide with one
+
+    def __init__(self, entries=()):
+        self.root = {}
+
+        for entry in entries:
+            self.insert(entry)
+
+    def __contains__(self, entry):
+        node = self.find_node(entry)
+        return node is not None and self.END in node
+
+    def insert(self, entry):
+        """
+        This function adds an entry to the trie, one node per character.
+
+        Parameters
+        ----------
+        entry - A word or phrase such as "take" or "downstairs bathroom"
+
+        Returns
+        -------
+        Nothing
+        """
+        node = self.root
+        for char in entry:
+            node = node.setdefault(char, {})
+        node[self.END] = node.get(self.END, 0) + 1
+
+    def remove(self, entry):
+        """
+        This function removes one reference to an entry. Once no references remain the entry is deleted, along with
+        any nodes left without entries below them.
+
+        Parameters
+        ----------
+        entry - A word or phrase previously passed to insert()
+
+        Returns
+        -------
+        Nothing
+        """
+        path = [self.root]
+        for char in entry:
+            if char not in path[-1]:
+                return
+            path.append(path[-1][char])
+
+        node = path[-1]
+        if self.END not in node:
+            return
+
+        node[self.END] -= 1
+        if node[self.END] > 0:
+            return
+        del node[self.END]
+
+        # Prune the now unused characters from the end of the entry backwards
+        for depth in range(len(entry), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][entry[depth - 1]]
+
+    def find_node(self, prefix):
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def complete(self, prefix):
+        """
+        This function collects every entry that starts with a prefix.
+
+        Parameters
+        ----------
+        prefix - The characters typed so far
+
+        Returns
+        -------
+        : sorted list of matching entries (the prefix itself is included if it is an entry)
+        """
+        node = self.find_node(prefix)
+        if node is None:
+            return []
+
+        matches = []
+        stack = [(prefix, node)]
+        while stack:
+            text, node = stack.pop()
+            for char, child in node.items():
+                if char == self.END:
+                    matches.append(text)
+                else:
+                    stack.append((text + char, child))
+
+        return sorted(matches)
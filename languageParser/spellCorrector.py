@@ -0,0 +1,127 @@
+class SpellCorrector:
+    """ Class that finds the closest vocabulary word to a misspelled word using a deletion dictionary (SymSpell)
+
+    Every vocabulary word is stored under each string that can be made from it by deleting up to max_distance
+    characters. A misspelled word generates its own deletions, and any vocabulary word sharing one of them is a
+    candidate. Only the candidates are compared with a real edit distance, so a lookup costs about the same no matter
+    how large the vocabulary is.
+
+    Attributes
+    ----------
+        words - Frozenset of the correctly spelled words
+        max_distance - The largest edit distance that will be corrected
+        min_length - Words shorter than this are never corrected (too many short words are one edit apart)
+        long_length - Words at least this long may be max_distance edits away. Shorter words get one edit
+        deletes - Dictionary of each deletion variant to the set of vocabulary words that produce it
+
+    Methods
+    -------
+    correct():
+        returns the unique closest vocabulary word to a misspelled word, or None
+    allowed_distance():
+        returns how many edits are tolerated for a word of a given length
+    generate_deletes():
+        returns every string made by deleting up to n characters from a word
+    edit_distance():
+        returns the optimal string alignment distance between two words
+    """
+
+    def __init__(self, words, max_distance=2, min_length=4, long_length=6):
+        self.words = frozenset(words)
+        self.max_distance = max_distance
+        self.min_length = min_length
+        self.long_length = long_length
+        self.deletes = {}
+
+        for word in self.words:
+            for variant in self.generate_deletes(word, max_distance):
+                self.deletes.setdefault(variant, set()).add(word)
+
+    def correct(self, word):
+        """
+        This function finds the vocabulary word closest to a word that isn't in the vocabulary.
+
+        Parameters
+        ----------
+        word - A lowercase word the player typed
+
+        Returns
+        -------
+        : the closest vocabulary word, or None if the word is too short, is already valid, has no close match, or has
+        several equally close matches
+        """
+        if word in self.words or len(word) < self.min_length:
+            return None
+
+        distance = self.allowed_distance(len(word))
+
+        candidates = set()
+        for variant in self.generate_deletes(word, distance):
+            candidates.update(self.deletes.get(variant, ()))
+
+        best = None
+        best_distance = distance + 1
+        tied = False
+
+        for candidate in candidates:
+            candidate_distance = self.edit_distance(word, candidate)
+            if candidate_distance < best_distance:
+                best = candidate
+                best_distance = candidate_distance
+                tied = False
+            elif candidate_distance == best_distance:
+                tied = True
+
+        if tied:
+            return None
+        return best
+
+    def allowed_distance(self, length):
+        """
+        This function allows one edit for short words and max_distance edits for words of long_length or more.
+        """
+        if length < self.long_length:
+            return min(1, self.max_distance)
+        return self.max_distance
+
+    @staticmethod
+    def generate_deletes(word, distance):
+        """
+        This function builds every string that can be made by deleting up to distance characters from word,
+        including word itself.
+        """
+        variants = {word}
+        frontier = {word}
+
+        for _ in range(distance):
+            next_frontier = set()
+            for variant in frontier:
+                for i in range(len(variant)):
+                    next_frontier.add(variant[:i] + variant[i + 1:])
+            variants.update(next_frontier)
+            frontier = next_frontier
+
+        return variants
+
+    @staticmethod
+    def edit_distance(first, second):
+        """
+        This function computes the optimal string alignment distance: insertions, deletions, substitutions and swaps
+        of two adjacent characters each cost one edit.
+        """
+        previous_row = None
+        row = list(range(len(second) + 1))
+
+        for i in range(1, len(first) + 1):
+            before_previous_row, previous_row = previous_row, row
+            row = [i] + [0] * len(second)
+
+            for j in range(1, len(second) + 1):
+                cost = 0 if first[i - 1] == second[j - 1] else 1
+                row[j] = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+
+                # Adjacent characters typed in the wrong order
+                if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+                    row[j] = min(row[j], before_previous_row[j - 2] + 1)
+
+        return row[len(second)]
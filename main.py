@@ -1,15 +1,31 @@
-import shutil
+import os
+import sys
 
 from Game import Game
+from Layout import layout
+from OutputSink import TerminalSink
+from Terminal import terminal
 
 def main():
 
-    cols, rows = shutil.get_terminal_size()
-    if cols != 125 or rows != 50:
-        print('This game requires an un-maximized window, and will then set itself to 125 cols * 50 rows')
-        print('Required screen resolution: >=1000pixels x >=1000pixels (e.g. 1920x1080)')
-        exit()
+    # Lay the text out for the terminal the game is running in, and follow it when it is resized. Without a terminal
+    # (output piped or captured) the game runs headless at the 125 x 50 size it was designed for
+    layout.detect()
+    layout.watch_resize()
+    terminal.detect()
+
+    # "--plain" (or the NO_COLOR environment variable) removes the color highlighting, "--cues" marks highlighted
+    # words with *asterisks*. Either way no color codes are written. The screen is still cleared and the ending
+    # cutscenes still pause, since that only depends on whether there is a terminal
+    color_mode = 'ansi'
+    if '--plain' in sys.argv or 'NO_COLOR' in os.environ:
+        color_mode = 'plain'
+    elif '--cues' in sys.argv:
+        color_mode = 'cues'
+
+    # The color mode belongs to this player's session, so it is kept on the Game's output sink
     game = Game()
+    game.output = TerminalSink(sys.stdout, color_mode)
     game.start()
 
 if __name__ == '__main__':
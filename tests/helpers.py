@@ -0,0 +1,19 @@
+import json
+import os
+from Game import Game
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NEW_GAME = os.path.join(ROOT, 'dataStore', 'newGame')
+
+
+def load_rooms():
+    """Loads the Rooms of a new game, as Game.run_game() does
+
+    :return: list of Rooms, indexed by room_id
+    """
+    with open(os.path.join(NEW_GAME, 'load_file.json'), 'r', encoding='utf-8') as game_file:
+        room_files = json.load(game_file)['rooms']
+    game = Game()
+    game.rooms_list = []
+    game.initialize_rooms(room_files, os.path.join(NEW_GAME, 'RoomState') + os.sep)
+    return game.rooms_list
@@ -0,0 +1,27 @@
+import asyncio
+import unittest
+from Cutscene import Cutscene
+from OutputSink import MemorySink
+
+
+class TestCutscene(unittest.TestCase):
+
+    def setUp(self):
+        self.cutscene = Cutscene().add('line', 'first').add('wait', 7).add('text', 'second').add('wait', 7)
+        self.cutscene.add('line', 'last')
+        self.sink = MemorySink()
+
+    def test_duration(self):
+        self.assertEqual(self.cutscene.duration(), 14)
+
+    def test_play_async_writes_to_the_sink(self):
+        asyncio.run(self.cutscene.play_async(self.sink, fast_forward=True))
+        self.assertEqual(self.sink.get_output().split(), ['first', 'second', 'last'])
+        # Everything shown before a wait is flushed before it
+        self.assertEqual(self.sink.blocks[0].split(), ['first'])
+        self.assertEqual(self.sink.writes, 3)
+
+    def test_play_writes_to_the_sink(self):
+        self.cutscene.play(self.sink, fast_forward=True)
+        self.assertEqual(self.sink.get_output().split(), ['first', 'second', 'last'])
+        self.assertEqual(self.sink.writes, 3)
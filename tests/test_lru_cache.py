@@ -0,0 +1,47 @@
+import unittest
+from LRUCache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_evicts_least_recently_put(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('c', 3)
+        self.assertEqual(list(cache.entries), ['b', 'c'])
+        self.assertIsNone(cache.get('a'))
+
+    def test_get_refreshes_an_entry(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertEqual(list(cache.entries), ['a', 'c'])
+        self.assertIsNone(cache.get('b'))
+
+    def test_put_refreshes_an_entry(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 10)
+        cache.put('c', 3)
+        self.assertEqual(cache.get('a'), 10)
+        self.assertNotIn('b', cache.entries)
+        self.assertEqual(len(cache), 2)
+
+    def test_counters(self):
+        cache = LRUCache(2)
+        self.assertEqual(cache.hit_rate(), 0.0)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.get('b', 'missing')
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_rate(), 0.5)
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
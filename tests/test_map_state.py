@@ -0,0 +1,37 @@
+import unittest
+from inventoryMapScreen import inventoryMapScreen
+from helpers import load_rooms
+
+
+class TestMapState(unittest.TestCase):
+
+    def setUp(self):
+        self.rooms = load_rooms()
+        self.state = inventoryMapScreen.MapState()
+        inventoryMapScreen.update_flags(self.rooms, self.state)
+        inventoryMapScreen.reset_exploration(self.rooms, 0, self.state)
+
+    def test_new_game_starts_with_its_own_flags(self):
+        self.rooms[18].add_direction('down', 24)
+        inventoryMapScreen.update_flags(self.rooms, self.state)
+        self.assertEqual(inventoryMapScreen.chooseMap(4, self.rooms, self.state), 'cellar_revealed')
+
+        # A new game loads fresh rooms, and its flags are worked out from those rooms rather than the last game's
+        rooms = load_rooms()
+        state = inventoryMapScreen.MapState()
+        self.assertEqual(inventoryMapScreen.chooseMap(4, rooms, state), 'cellar_base_state')
+        self.assertEqual(inventoryMapScreen.chooseMap(4, self.rooms, self.state), 'cellar_revealed')
+
+    def test_exploration_is_kept_per_game(self):
+        other = inventoryMapScreen.MapState()
+        inventoryMapScreen.reset_exploration(self.rooms, 0, other)
+        inventoryMapScreen.explore(1, self.state)
+        self.assertIn(1, self.state.explored)
+        self.assertNotIn(1, other.explored)
+
+    def test_reset_starts_from_visited_rooms(self):
+        inventoryMapScreen.explore(5, self.state)
+        self.rooms[1].set_visited()
+        inventoryMapScreen.reset_exploration(self.rooms, 2, self.state)
+        self.assertEqual(self.state.explored, {room.room_id for room in self.rooms if room.visited} | {2})
+        self.assertNotIn(5, self.state.explored)
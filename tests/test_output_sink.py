@@ -0,0 +1,111 @@
+import asyncio
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+from Game import Game
+from Outcome import Outcome
+from OutputSink import MemorySink, OutputSink, SessionStdout, TerminalSink, session_output
+from helpers import NEW_GAME
+
+
+class TestOutputSink(unittest.TestCase):
+
+    def test_sink_without_emit_cannot_be_made(self):
+        class Unfinished(OutputSink):
+            pass
+
+        with self.assertRaises(TypeError):
+            OutputSink()
+        with self.assertRaises(TypeError):
+            Unfinished()
+
+    def test_flush_emits_once(self):
+        sink = MemorySink()
+        print('one', file=sink)
+        print('two', file=sink)
+        sink.flush()
+        sink.flush()
+        self.assertEqual(sink.blocks, ['one\ntwo\n'])
+        self.assertEqual(sink.writes, 1)
+
+
+class TestSessionOutput(unittest.TestCase):
+
+    def test_output_outside_a_session_goes_to_stdout(self):
+        with session_output(MemorySink()):
+            pass
+        self.assertIsInstance(sys.stdout, SessionStdout)
+        print('after')
+        self.assertEqual(sys.stdout.get_target(), sys.stdout.stream)
+
+    def test_terminal_sink_writes_to_the_real_stream(self):
+        with session_output(MemorySink()):
+            sink = TerminalSink(sys.stdout)
+        self.assertIs(sink.stream, sys.stdout.stream)
+
+    def test_threads_keep_their_own_output(self):
+        sinks = [MemorySink(), MemorySink()]
+        barrier = threading.Barrier(2)
+
+        def session(number):
+            with session_output(sinks[number]):
+                for turn in range(3):
+                    barrier.wait()
+                    print('session', number, 'turn', turn)
+
+        threads = [threading.Thread(target=session, args=(number,)) for number in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for number, sink in enumerate(sinks):
+            self.assertEqual(sink.get_output().splitlines(),
+                             ['session {} turn {}'.format(number, turn) for turn in range(3)])
+
+    def test_tasks_keep_their_own_output(self):
+        sinks = [MemorySink(), MemorySink()]
+
+        async def session(number):
+            with session_output(sinks[number]):
+                for turn in range(3):
+                    print('session', number, 'turn', turn)
+                    await asyncio.sleep(0)
+
+        async def serve():
+            await asyncio.gather(session(0), session(1))
+
+        asyncio.run(serve())
+        for number, sink in enumerate(sinks):
+            self.assertEqual(sink.get_output().count('session {}'.format(number)), 3)
+            self.assertNotIn('session {}'.format(1 - number), sink.get_output())
+
+    def test_games_in_threads(self):
+        commands = {'first': iter(['look at fireplace', 'exit']), 'second': iter(['move north', 'exit'])}
+        games = {name: Game() for name in commands}
+        outcomes = {}
+
+        def play(name):
+            games[name].output = MemorySink()
+            outcomes[name] = games[name].play_game(os.path.join(NEW_GAME, 'load_file.json'),
+                                                   os.path.join(NEW_GAME, 'RoomState') + os.sep, [])
+
+        def fake_input(prompt=''):
+            return next(commands[threading.current_thread().name])
+
+        with mock.patch('builtins.input', fake_input):
+            threads = [threading.Thread(target=play, args=(name,), name=name) for name in commands]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(outcomes, {'first': Outcome.QUIT, 'second': Outcome.QUIT})
+        first = games['first'].output.get_output()
+        second = games['second'].output.get_output()
+        self.assertEqual(first.count('CURRENT LOCATION: Parlor'), 1)
+        self.assertEqual(second.count('CURRENT LOCATION: Parlor'), 1)
+        self.assertNotIn('CURRENT LOCATION: Dining Room', first)
+        self.assertEqual(second.count('CURRENT LOCATION: Dining Room'), 1)
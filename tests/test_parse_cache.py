@@ -0,0 +1,62 @@
+import unittest
+from Hero import Hero
+from Inventory import Inventory
+from languageParser import languageParser
+from helpers import load_rooms
+
+# Rooms used below
+PARLOR = 0
+GAZEBO = 18
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = languageParser.LanguageParser()
+        self.rooms = load_rooms()
+        self.inventory = Inventory([])
+
+    def parse(self, text, location):
+        return self.parser.parse(text, self.rooms, Hero('Player', location, 9, 0), self.inventory)
+
+    def test_repeated_input_is_cached(self):
+        first = self.parse('take pocketwatch', PARLOR)
+        self.assertIs(self.parse('take pocketwatch', PARLOR), first)
+        self.assertEqual(self.parser.parse_cache.hits, 1)
+
+    def test_new_exit_invalidates(self):
+        self.assertFalse(self.parse('go down', GAZEBO).is_valid())
+        self.assertFalse(self.parse('go down', GAZEBO).is_valid())
+
+        # As prying the plank off does
+        self.rooms[GAZEBO].add_direction('down', 24)
+        command = self.parse('go down', GAZEBO)
+        self.assertTrue(command.is_valid())
+        self.assertEqual((command.verb, command.obj), ('move', 'down'))
+
+    def test_room_contents_change_invalidates(self):
+        self.assertTrue(self.parse('take pocketwatch', PARLOR).is_valid())
+
+        status, item = self.rooms[PARLOR].take_item('pocketwatch')
+        self.assertTrue(status)
+        self.assertEqual(self.parse('take pocketwatch', PARLOR).error, 'take_missing')
+
+        self.rooms[PARLOR].leave_item(item)
+        self.assertTrue(self.parse('take pocketwatch', PARLOR).is_valid())
+
+    def test_inventory_change_invalidates(self):
+        self.assertEqual(self.parse('drop pocketwatch', PARLOR).error, 'drop_missing')
+
+        status, item = self.rooms[PARLOR].take_item('pocketwatch')
+        self.inventory.add_item(item)
+        command = self.parse('drop pocketwatch', PARLOR)
+        self.assertTrue(command.is_valid())
+        self.assertEqual((command.verb, command.obj), ('drop', 'pocketwatch'))
+
+    def test_different_rooms_are_cached_apart(self):
+        self.assertTrue(self.parse('look at couch', PARLOR).is_valid())
+        self.assertFalse(self.parse('look at couch', GAZEBO).is_valid())
+
+
+if __name__ == '__main__':
+    unittest.main()
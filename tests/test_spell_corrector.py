@@ -0,0 +1,72 @@
+import unittest
+from Hero import Hero
+from Inventory import Inventory
+from languageParser import languageParser
+from languageParser.spellCorrector import SpellCorrector
+from helpers import load_rooms
+
+FOYER = 1
+
+
+class TestSpellCorrector(unittest.TestCase):
+
+    def setUp(self):
+        self.spelling = SpellCorrector(['north', 'south', 'take', 'kitchen', 'library', 'soup'])
+
+    def test_distance_one(self):
+        self.assertEqual(self.spelling.correct('norh'), 'north')
+        self.assertEqual(self.spelling.correct('tkae'), 'take')
+        self.assertEqual(self.spelling.correct('librar'), 'library')
+
+    def test_distance_two_for_long_words(self):
+        self.assertEqual(self.spelling.correct('kichenn'), 'kitchen')
+        self.assertEqual(self.spelling.correct('lbrary'), 'library')
+
+    def test_short_words_get_one_edit(self):
+        self.assertEqual(SpellCorrector.edit_distance('nxrtx', 'north'), 2)
+        self.assertIsNone(self.spelling.correct('nxrtx'))
+
+    def test_tie_is_not_corrected(self):
+        # One edit from both "south" and "soup"
+        self.assertEqual(SpellCorrector.edit_distance('sout', 'south'), 1)
+        self.assertEqual(SpellCorrector.edit_distance('sout', 'soup'), 1)
+        self.assertIsNone(self.spelling.correct('sout'))
+
+    def test_no_match(self):
+        self.assertIsNone(self.spelling.correct('xyzzy'))
+        self.assertIsNone(self.spelling.correct('kxxxxxn'))
+
+    def test_valid_and_short_words_are_left(self):
+        self.assertIsNone(self.spelling.correct('north'))
+        self.assertIsNone(self.spelling.correct('nrt'))
+
+    def test_edit_distance(self):
+        self.assertEqual(SpellCorrector.edit_distance('take', 'take'), 0)
+        self.assertEqual(SpellCorrector.edit_distance('tkae', 'take'), 1)
+        self.assertEqual(SpellCorrector.edit_distance('', 'take'), 4)
+        self.assertEqual(SpellCorrector.edit_distance('kitten', 'sitting'), 3)
+
+
+class TestParserCorrection(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = languageParser.LanguageParser()
+        self.rooms = load_rooms()
+
+    def parse(self, text, location):
+        return self.parser.parse(text, self.rooms, Hero('Player', location, 9, 0), Inventory([]))
+
+    def test_misspelled_direction(self):
+        command = self.parse('walk sout', FOYER)
+        self.assertEqual((command.verb, command.obj), ('move', 'south'))
+        self.assertEqual(command.corrections, (('sout', 'south'),))
+
+    def test_correction_kept_only_if_valid(self):
+        # The parlor has no exit south, so the correction doesn't make a valid command and isn't applied
+        command = self.parse('walk sout', 0)
+        self.assertFalse(command.is_valid())
+        self.assertEqual(command.corrections, ())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from Item import Item
+from Outcome import Outcome
+from Task import Task
+from helpers import load_rooms
+
+
+class TestRuleTable(unittest.TestCase):
+
+    def setUp(self):
+        self.task = Task()
+        self.rooms = load_rooms()
+        self.output = io.StringIO()
+
+    def perform(self, item, room_id=None, feature_name=None):
+        feature = None
+        if room_id is not None:
+            status, feature = self.rooms[room_id].get_feature(feature_name)
+        with contextlib.redirect_stdout(self.output):
+            return self.task.perform_task(item, feature, self.rooms)
+
+    def test_taking_an_item_sets_a_feature_state(self):
+        self.assertTrue(self.perform(Item('paintbrush', 'A paintbrush.', None)))
+        status, table = self.rooms[10].get_feature('table')
+        self.assertEqual(table.state, 2)
+
+    def test_use_adds_an_exit(self):
+        self.assertTrue(self.perform(Item('prybar', 'A prybar.', None), 18, 'plank'))
+        status, plank = self.rooms[18].get_feature('plank')
+        self.assertEqual(plank.state, 2)
+        self.assertEqual(self.rooms[18].directions['down'], 24)
+        self.assertFalse(self.rooms[18].visited)
+        self.assertIn(plank.in_action_des.split()[0], self.output.getvalue())
+
+    def test_rule_matched_on_item_description(self):
+        self.assertFalse(self.perform(Item('key', 'A simple key.', None), 7, 'drawer'))
+        self.assertTrue(self.perform(Item('key', 'A small ornate key.', None), 7, 'drawer'))
+        status, drawer = self.rooms[7].get_feature('drawer')
+        self.assertEqual(drawer.state, 1)
+        self.assertIn('unlocked and now open', self.rooms[7].short_des)
+
+    def test_unusable_feature(self):
+        self.assertFalse(self.perform(Item('knife', 'A knife.', None), 7, 'chef'))
+
+    def test_end_game_effect(self):
+        self.assertFalse(self.perform(Item('knife', 'A knife.', None), 17, 'chef'))
+        self.assertEqual(self.task.outcome, Outcome.WON_A)
+        self.assertIn('You have won the game.', self.output.getvalue())
+
+    def test_unknown_combination(self):
+        self.assertFalse(self.perform(Item('spade', 'A spade.', None), 18, 'plank'))
+        self.assertEqual(self.output.getvalue(), '')
+
+    def test_choice_waits_for_an_answer(self):
+        self.assertFalse(self.perform(Item('ashes', 'Ashes.', None), 4, 'fireplace'))
+        self.assertEqual(self.task.choice[0], 'fireplace A')
+        self.assertIsNone(self.task.outcome)
+        self.assertIn('You have a choice to make', self.output.getvalue())
+
+    def test_invalid_answer_offers_the_choice_again(self):
+        self.perform(Item('ashes', 'Ashes.', None), 4, 'fireplace')
+        for answer in ('fight', '', '3'):
+            with contextlib.redirect_stdout(self.output):
+                self.assertIsNone(self.task.make_choice(answer))
+            self.assertIsNotNone(self.task.choice)
+        self.assertEqual(self.output.getvalue().count('You have a choice to make'), 4)
+
+    def test_answer_plays_its_ending(self):
+        self.perform(Item('ashes', 'Ashes.', None), 4, 'fireplace')
+        with contextlib.redirect_stdout(self.output):
+            self.assertEqual(self.task.make_choice(' 2 '), Outcome.LOST_A)
+        self.assertIsNone(self.task.choice)
+        self.assertIn('The fireplace explodes', self.output.getvalue())
+
+    def test_outcome_is_recorded_after_the_cutscene(self):
+        played = []
+
+        def player(cutscene, output):
+            played.append(self.task.outcome)
+
+        self.task = Task(cutscene_player=player, output=self.output)
+        self.perform(Item('knife', 'A knife.', None), 17, 'chef')
+        self.assertEqual(played, [None])
+        self.assertEqual(self.task.outcome, Outcome.WON_A)
+
+
+class TestRuleLoader(unittest.TestCase):
+
+    def write_rules(self, effects):
+        table = {'rules': [{'item': 'spade', 'feature': 'grave', 'effects': effects}]}
+        rules_file = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8')
+        with rules_file:
+            json.dump(table, rules_file)
+        self.addCleanup(os.remove, rules_file.name)
+        return rules_file.name
+
+    def test_stock_table_loads(self):
+        task = Task()
+        self.assertIn(('prybar', 'plank'), task.rules)
+        self.assertIn((6, 'dog'), task.looks)
+
+    def test_known_effects_load(self):
+        task = Task(self.write_rules([{'room': 21, 'feature': 'grave', 'set': {'state': 1}}, {'show': True}]))
+        self.assertEqual(len(task.rules[('spade', 'grave')]), 1)
+
+    def test_unknown_effect_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Task(self.write_rules([{'explode': True}]))
+
+    def test_effect_with_two_actions_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Task(self.write_rules([{'say': 'Hello', 'show': True}]))
+
+
+if __name__ == '__main__':
+    unittest.main()
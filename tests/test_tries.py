@@ -0,0 +1,59 @@
+import unittest
+from languageParser.phraseTrie import PhraseTrie
+from languageParser.prefixTrie import PrefixTrie
+
+
+class TestPhraseTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = PhraseTrie(['downstairs', 'downstairs bathroom', 'bathroom', 'key', 'small bed', 'go'])
+
+    def test_longest_match(self):
+        self.assertEqual(self.trie.segment('go downstairs bathroom'.split()), ['go', 'downstairs bathroom'])
+
+    def test_shorter_match_when_longer_one_is_incomplete(self):
+        self.assertEqual(self.trie.segment('downstairs key'.split()), ['downstairs', 'key'])
+
+    def test_unknown_words_are_skipped(self):
+        self.assertEqual(self.trie.segment('take the small bed now'.split()), ['small bed'])
+        self.assertEqual(self.trie.segment('small table'.split()), [])
+
+    def test_partial_phrase_does_not_swallow_next_word(self):
+        trie = PhraseTrie(['a', 'a b c', 'b'])
+        self.assertEqual(trie.segment(['a', 'b', 'd']), ['a', 'b'])
+        self.assertEqual(trie.segment(['a', 'b', 'c']), ['a b c'])
+
+
+class TestPrefixTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = PrefixTrie(['take', 'talk', 'table', 'tab', 'north'])
+
+    def test_complete(self):
+        self.assertEqual(self.trie.complete('ta'), ['tab', 'table', 'take', 'talk'])
+        self.assertEqual(self.trie.complete('tab'), ['tab', 'table'])
+        self.assertEqual(self.trie.complete('x'), [])
+        self.assertIn('north', self.trie)
+        self.assertNotIn('nor', self.trie)
+
+    def test_remove_prunes_branches(self):
+        self.trie.remove('north')
+        self.assertNotIn('north', self.trie)
+        self.assertNotIn('n', self.trie.root)
+
+    def test_remove_keeps_longer_entries(self):
+        self.trie.remove('tab')
+        self.assertEqual(self.trie.complete('tab'), ['table'])
+
+    def test_entries_are_reference_counted(self):
+        self.trie.insert('take')
+        self.trie.remove('take')
+        self.assertIn('take', self.trie)
+        self.trie.remove('take')
+        self.assertNotIn('take', self.trie)
+        self.trie.remove('take')
+        self.assertEqual(self.trie.complete('ta'), ['tab', 'table', 'talk'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import textwrap
+import threading
+import unittest
+from OutputSink import MemorySink, session_output
+from Wrapper import benchmark
+from Wrapper import wrapper
+from helpers import load_rooms
+
+# Text widths and margins the Game is laid out at: the design size and a narrow and a wide terminal
+SIZES = ((80, ' ' * 20), (40, ' ' * 4), (150, ' ' * 30))
+
+
+class TestWrapper(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.texts = benchmark.load_texts()
+
+    def setUp(self):
+        wrapper.render_cache.clear()
+        wrapper.token_cache.clear()
+
+    def test_texts_found(self):
+        self.assertGreater(len(self.texts), 100)
+
+    def test_wrap_processor_matches_legacy(self):
+        for text in self.texts:
+            with self.subTest(text=text[:40]):
+                self.assertEqual(wrapper.wrap_processor(text, 80, ' ' * 20), benchmark.legacy_wrap_processor(text))
+
+    def test_render_markup_matches_legacy(self):
+        for text in self.texts:
+            with self.subTest(text=text[:40]):
+                expected = benchmark.legacy_wrap_processor(text)
+                self.assertEqual(list(wrapper.render_markup(text, 80, ' ' * 20)), expected)
+
+    def test_render_matches_textwrap_fill(self):
+        plain = [text for text in self.texts
+                 if not any(character in text for character in wrapper.SPECIAL_CHARACTERS)]
+        self.assertTrue(plain)
+        # Each size twice: rendered, then taken from the caches after the other sizes have been rendered
+        for width, indent in SIZES + SIZES:
+            for text in plain:
+                with self.subTest(text=text[:40], width=width):
+                    expected = textwrap.fill(text, width + len(indent), initial_indent=indent,
+                                             subsequent_indent=indent)
+                    self.assertEqual(wrapper.render(text, width, indent), (expected,))
+
+    def test_chunk_wrapper_matches_fill(self):
+        for text in self.texts:
+            for width, indent in SIZES:
+                with self.subTest(text=text[:40], width=width):
+                    filler = wrapper.ChunkWrapper(width, initial_indent=indent, subsequent_indent=indent)
+                    self.assertEqual(filler.fill_chunks(wrapper.chunker.split_chunks(text)), filler.fill(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+class TestColorModes(unittest.TestCase):
+
+    TEXT = 'A ^fireplace# to the $North#.'
+
+    def setUp(self):
+        wrapper.render_cache.clear()
+        wrapper.token_cache.clear()
+
+    def render_in(self, color_mode):
+        with session_output(MemorySink(color_mode)):
+            return wrapper.render(self.TEXT, 80, ' ' * 20)
+
+    def test_modes_render_differently(self):
+        self.assertIn('\033[1;35mfireplace\033[0m', self.render_in('ansi')[0])
+        self.assertEqual(self.render_in('plain')[0].split(), ['A', 'fireplace', 'to', 'the', 'North.'])
+        self.assertEqual(self.render_in('cues')[0].split(), ['A', '*fireplace*', 'to', 'the', '*North*.'])
+
+    def test_outside_a_session_is_ansi(self):
+        self.assertEqual(wrapper.render(self.TEXT, 80, ' ' * 20), self.render_in('ansi'))
+
+    def test_sessions_in_threads_keep_their_mode(self):
+        modes = ('ansi', 'plain', 'cues') * 4
+        results = {}
+        threads = [threading.Thread(target=lambda n=n: results.update({n: self.render_in(modes[n])}))
+                   for n in range(len(modes))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for n, mode in enumerate(modes):
+            self.assertEqual(results[n], wrapper.render(self.TEXT, 80, ' ' * 20, mode))
+
+    def test_compiled_field_follows_the_mode(self):
+        room = load_rooms()[0]
+        with session_output(MemorySink('plain')):
+            plain = wrapper.render_field(room, 'long_des')
+        with session_output(MemorySink('ansi')):
+            ansi = wrapper.render_field(room, 'long_des')
+        self.assertNotIn('\033', plain)
+        self.assertIn('\033', ansi)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            MemorySink('sepia')